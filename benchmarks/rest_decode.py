@@ -0,0 +1,149 @@
+"""Parse-time benchmark for REST response decoding.
+
+Decodes a synthetic ``residences/{id}/iotswitches`` payload (switches
+with their ``iotButtons`` included) the way ``LevitonAPI`` used to, with
+``json.loads(response.text)`` per lookup, and through the single-parse
+``response_json`` codec. Results are milliseconds of CPU time per
+response on a single core.
+
+Usage::
+
+    python benchmarks/rest_decode.py [switches] [iterations]
+"""
+
+import json
+from pathlib import Path
+import sys
+import time
+
+import requests
+
+# Appended rather than prepended: the integration has modules (select,
+# number, ...) that would otherwise shadow the standard library.
+sys.path.append(
+    str(Path(__file__).parents[1] / "custom_components" / "leviton_decora_smart_wifi")
+)
+
+from api import util
+
+
+def switch(index: int) -> dict:
+    """Return an IotSwitch shaped like the ones the API sends."""
+    return {
+        "id": 100000 + index,
+        "name": f"Switch {index}",
+        "model": "D26HD",
+        "manufacturer": "Leviton Manufacturing Co., Inc.",
+        "serial": f"1000{index:08d}",
+        "mac": f"00:11:22:33:{index // 256 % 256:02x}:{index % 256:02x}",
+        "version": "2.1.15",
+        "residenceId": 1234,
+        "residentialRoomId": 5678,
+        "iotBridgeId": None,
+        "iotBridgeSerial": None,
+        "localIP": f"192.168.1.{index % 250 + 2}",
+        "lastUpdated": "2026-01-01T00:00:00.000Z",
+        "created": "2024-01-01T00:00:00.000Z",
+        "connected": True,
+        "rssi": -61,
+        "power": "ON",
+        "brightness": 42,
+        "minLevel": 1,
+        "maxLevel": 100,
+        "presetLevel": 0,
+        "canSetLevel": True,
+        "loadType": "incandescent",
+        "fadeOnTime": 0,
+        "fadeOffTime": 0,
+        "autoOffTime": 0,
+        "dimLED": 0,
+        "statusLED": "ON",
+        "lightEnable": True,
+        "enableBuzzer": False,
+        "isRandomEnabled": False,
+        "smartBulbModeEnabled": False,
+        "reversePhase": False,
+        "triacOff": False,
+        "fault": 0,
+        "otaStatus": None,
+        "downloaded": None,
+        "motionMode": "Off",
+        "motionTimeout": "10m",
+        "motionLED": "On",
+        "motionNightMode": "Off",
+        "motionNightLevel": 10,
+        "motionAmbientThr": 0,
+        "motionDisable": False,
+        "motionDisableTime": 0,
+        "motionOccupied": False,
+        "matterManualCode": "0000-000-0000",
+        "matterQRCode": "MT:Y.K9042C00KA0648G00",
+        "iotButtons": [
+            {
+                "id": 200000 + index * 4 + number,
+                "number": number,
+                "text": f"Button {number}",
+                "configurationType": "scene",
+                "iotButtonActions": [],
+                "parameters": [
+                    {"parameterValue": "1", "text": "Press"},
+                    {"parameterValue": "2", "text": "Hold"},
+                ],
+            }
+            for number in range(4)
+        ],
+    }
+
+
+def response(body: bytes) -> requests.Response:
+    """Return a response as requests builds it from the wire."""
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.headers["Content-Type"] = "application/json; charset=utf-8"
+    resp.encoding = "utf-8"
+    resp._content = body
+    return resp
+
+
+def legacy_parse(resp: requests.Response) -> object:
+    """Decode as before: text first, then stdlib json."""
+    return json.loads(resp.text)
+
+
+def run(label: str, parse, body: bytes, iterations: int) -> float:
+    """Time ``iterations`` decodes of fresh responses, print ms/response."""
+    start = time.process_time()
+    for _ in range(iterations):
+        parse(response(body))
+    elapsed = (time.process_time() - start) / iterations * 1000
+    print(f"{label:<22} {elapsed:>8.2f} ms/response")
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    switches = int(sys.argv[1]) if len(sys.argv) > 1 else 250
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    body = json.dumps([switch(index) for index in range(switches)]).encode()
+    print(f"payload: {switches} switches, {len(body) / 1024:,.0f} KiB")
+
+    before = run("before (200)", legacy_parse, body, iterations)
+    run(
+        "before (error path)",
+        lambda resp: (legacy_parse(resp), legacy_parse(resp)),
+        body,
+        iterations,
+    )
+    after = run("after", util.response_json, body, iterations)
+    run(
+        "after (error path)",
+        lambda resp: (util.response_json(resp), util.response_json(resp)),
+        body,
+        iterations,
+    )
+    backend = "json" if util.orjson is None else "orjson"
+    print(f"decoder: {backend}, speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Memory benchmark for the ``LevitonData`` snapshot kept between polls.
+
+Builds the residences of an account through ``LevitonAPI.get_residences``
+with the REST calls answered from memory, as in the updates between the
+full ones: once keeping the raw responses and once projected to the
+attributes the models read. Reports what tracemalloc sees retained by
+each snapshot and at peak while building it.
+
+The account is either synthetic, or the responses saved by the
+integration's "save responses" option (``api/responses``) for a real
+one::
+
+    python benchmarks/snapshot_memory.py [residences] [switches]
+    python benchmarks/snapshot_memory.py path/to/responses
+"""
+
+import gc
+import json
+from pathlib import Path
+import sys
+import tracemalloc
+
+from rest_decode import switch
+
+# Appended rather than prepended: the integration has modules (select,
+# number, ...) that would otherwise shadow the standard library.
+sys.path.append(
+    str(Path(__file__).parents[1] / "custom_components" / "leviton_decora_smart_wifi")
+)
+
+from api import LevitonAPI, LevitonData, util
+
+USER_ID = "1"
+ACCOUNT_ID = 7
+
+
+def saved_name(url: str) -> str:
+    """Return the file name ``save_response`` gives a URL's response."""
+    return url.replace("/", "_").replace(".", "_")
+
+
+def synthetic(residences: int, switches: int) -> dict[str, bytes]:
+    """Return the response bodies of a synthetic account, by saved name.
+
+    Switches carry a button action each, and every object a handful of
+    attributes the models don't read, standing in for the rest of what
+    the cloud sends.
+    """
+    unread = {"modified": "2026-01-01T00:00:00.000Z", "ownerId": 42, "tags": []}
+    bodies = {
+        saved_name(f"person/{USER_ID}/residentialpermissions"): [
+            {"id": 1, "residentialAccountId": ACCOUNT_ID, "access": "owner", **unread}
+        ],
+        saved_name(f"residentialaccounts/{ACCOUNT_ID}/residences"): [],
+    }
+    for index in range(residences):
+        residence_id = 1000 + index
+        bodies[saved_name(f"residentialaccounts/{ACCOUNT_ID}/residences")].append(
+            {
+                "id": residence_id,
+                "name": f"Residence {index}",
+                "residentialAccountId": ACCOUNT_ID,
+                "locality": "Melville",
+                "region": "NY",
+                "timezone": {"id": "America/New_York"},
+                "geopoint": {"lat": 40.79, "lng": -73.42},
+                "imageUrl": "https://example.invalid/residence.png",
+                **unread,
+            }
+        )
+        devices = []
+        for number in range(switches):
+            device = switch(index * switches + number)
+            for button in device["iotButtons"]:
+                button["iotButtonActions"] = [
+                    {
+                        "id": button["id"],
+                        "iotButtonId": button["id"],
+                        "type": "scene",
+                        "parameters": button.pop("parameters"),
+                        **unread,
+                    }
+                ]
+            devices.append({**device, **unread})
+        bodies[saved_name(f"residences/{residence_id}/iotswitches")] = devices
+        bodies[saved_name(f"residences/{residence_id}/residentialrooms")] = [
+            {
+                "id": room,
+                "name": f"Room {room}",
+                "power": "ON",
+                "allConnected": True,
+                "residenceId": residence_id,
+                "residentialScenes": [
+                    {"id": room * 10 + scene, "name": f"Scene {scene}", **unread}
+                    for scene in range(5)
+                ],
+                **unread,
+            }
+            for room in range(switches // 10)
+        ]
+        bodies[saved_name(f"residences/{residence_id}/residentialactivities")] = [
+            {"id": activity, "name": f"Activity {activity}", **unread}
+            for activity in range(10)
+        ]
+        bodies[saved_name(f"residences/{residence_id}/residentialschedules")] = [
+            {"id": schedule, "name": f"Schedule {schedule}", "disabled": False}
+            for schedule in range(20)
+        ]
+    return {name: json.dumps(body).encode() for name, body in bodies.items()}
+
+
+def saved(location: Path) -> tuple[str, dict[str, bytes]]:
+    """Return the user ID and response bodies saved for a real account."""
+    permissions = next(location.glob("person_*_residentialpermissions.json"))
+    user_id = permissions.stem.split("_")[1]
+    return user_id, {path.stem: path.read_bytes() for path in location.glob("*.json")}
+
+
+def measure(label: str, user_id: str, bodies: dict[str, bytes], keep_raw: bool) -> int:
+    """Build a snapshot, print and return the bytes it retains."""
+    client = LevitonAPI(user_id=user_id, keep_raw=keep_raw)
+    client.call = lambda **kwargs: util.json_loads(bodies[saved_name(kwargs["url"])])
+    gc.collect()
+    tracemalloc.start()
+    data = LevitonData({"residences": list(client.get_residences(full=False))})
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    devices = sum(len(residence.devices) for residence in data.residences)
+    print(
+        f"{label:<10} {retained / 1024:>10,.0f} KiB retained"
+        f" {peak / 1024:>10,.0f} KiB peak ({devices:,} switches)"
+    )
+    client.close()
+    return retained
+
+
+def main() -> None:
+    """Run the benchmark."""
+    if len(sys.argv) > 1 and Path(sys.argv[1]).is_dir():
+        user_id, bodies = saved(Path(sys.argv[1]))
+    else:
+        residences = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+        switches = int(sys.argv[2]) if len(sys.argv) > 2 else 250
+        user_id, bodies = USER_ID, synthetic(residences, switches)
+    print(f"responses: {sum(map(len, bodies.values())) / 1024:,.0f} KiB of JSON")
+
+    before = measure("raw", user_id, bodies, keep_raw=True)
+    after = measure("projected", user_id, bodies, keep_raw=False)
+    print(f"snapshot: {after / before:.0%} of raw")
+
+
+if __name__ == "__main__":
+    main()
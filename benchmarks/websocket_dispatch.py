@@ -0,0 +1,92 @@
+"""Frame-throughput benchmark for ``LevitonWebSocket._dispatch_batch``.
+
+Compares the legacy dispatch path (stdlib ``json.loads`` plus an eager
+``json.dumps(..., sort_keys=True)`` for the debug log) with the current
+one, frame by frame and as a burst of frames for one device that gets
+coalesced into a single notification. Results are frames/sec of CPU time on a single core, with debug
+logging disabled, which is how the integration normally runs.
+
+Usage::
+
+    python benchmarks/websocket_dispatch.py [frames]
+"""
+
+import json
+import logging
+from pathlib import Path
+import sys
+import time
+
+# Appended rather than prepended: the integration has modules (select,
+# number, ...) that would otherwise shadow the standard library.
+sys.path.append(
+    str(Path(__file__).parents[1] / "custom_components" / "leviton_decora_smart_wifi")
+)
+
+from api import util, websocket
+
+FRAME = json.dumps(
+    {
+        "type": "notification",
+        "notification": {
+            "modelName": "IotSwitch",
+            "modelId": 123456,
+            "data": {
+                "brightness": 42,
+                "power": "ON",
+                "connected": True,
+                "rssi": -61,
+                "lastUpdated": "2026-01-01T00:00:00.000Z",
+                "btnPress": [{"button": 1, "trigger": 1}],
+            },
+        },
+    }
+)
+
+
+def legacy_dispatch(raw: str, on_notification) -> None:
+    """Dispatch path as it was before lazy logging and the fast decoder."""
+    payload = json.loads(raw)
+    if payload.get("type") == "notification":
+        websocket._LOGGER.debug(
+            "WebSocket notification: %s", json.dumps(payload, sort_keys=True)
+        )
+        on_notification(payload.get("notification") or {})
+
+
+def run(label: str, dispatch, calls: int, per_call: int = 1) -> float:
+    """Time ``calls`` dispatches and print frames/sec of CPU time."""
+    start = time.process_time()
+    for _ in range(calls):
+        dispatch(FRAME)
+    elapsed = time.process_time() - start
+    rate = calls * per_call / elapsed
+    print(f"{label:<8} {rate:>12,.0f} frames/s/core")
+    return rate
+
+
+def main() -> None:
+    """Run the benchmark."""
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    logging.basicConfig(level=logging.INFO)
+    client = object.__new__(websocket.LevitonWebSocket)
+    handled = []
+    client._on_notification = handled.append
+    client.stats = websocket.LevitonWebSocketStats()
+
+    before = run("before", lambda raw: legacy_dispatch(raw, lambda n: None), frames)
+    after = run("after", lambda raw: client._dispatch_batch([raw]), frames)
+    burst = [FRAME] * 10
+    run(
+        "burst",
+        lambda raw: client._dispatch_batch(burst),
+        frames // len(burst),
+        len(burst),
+    )
+    print(f"burst handler calls: {len(handled) - frames:,} for {frames:,} frames")
+    backend = "json" if util.orjson is None else "orjson"
+    print(f"decoder: {backend}, speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,44 +1,69 @@
 """The Leviton Decora Smart Wi-Fi integration."""
 
-from asyncio import timeout
+from asyncio import Future, timeout
+from collections.abc import Callable
 from datetime import timedelta
+from functools import partial
 import logging
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    CONF_EMAIL,
     CONF_ID,
     CONF_NAME,
+    CONF_PASSWORD,
     CONF_SCAN_INTERVAL,
     CONF_TOKEN,
     Platform,
 )
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import device_registry as dr
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_point_in_utc_time,
+)
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import LevitonAPI, LevitonData, LevitonException
+from .api.auth import LevitonTokenManager
+from .api.const import LoginResult, ModelName, ResidenceEndpoint
+from .api.executor import LevitonExecutor
+from .api.residence import Residence
 from .api.websocket import LevitonWebSocket
 from .config_flow import LevitonConfigFlow
 from .const import (
     CONF_DEVICES,
+    CONF_HEDGE_REQUESTS,
     CONF_LOGIN_RESPONSE,
     CONF_RESIDENCES,
+    CONF_RETRIES,
     CONF_SAVE_RESPONSES,
     CONF_TIMEOUT,
     CONFIGURATION_URL,
     DATA_API,
     DATA_COORDINATOR,
+    DATA_OPTIONS,
     DATA_WEBSOCKET,
+    DEFAULT_HEDGE_REQUESTS,
     DEFAULT_SAVE_LOCATION,
     DEFAULT_SAVE_RESPONSES,
     DEVICE_INFO_MANUFACTURER,
     DEVICE_INFO_MODEL_RESIDENCE,
     DOMAIN,
     EVENT_NOTIFICATION,
+    PREWARM_LEAD,
+    RESIDENCE_NOTIFICATION,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    TOKEN_REFRESH_RETRY,
     UNDO_UPDATE_LISTENER,
     UPDATE_NOTIFICATION,
+    Retries,
     ScanInterval,
     Timeout,
 )
@@ -64,6 +89,45 @@ _LOGGER = logging.getLogger(__name__)
 class LevitonDataUpdateCoordinator(DataUpdateCoordinator[LevitonData]):
     """Class to manage fetching data from single endpoint."""
 
+    def __init__(self, *args: Any, executor: LevitonExecutor, **kwargs: Any) -> None:
+        """Initialize."""
+        super().__init__(*args, **kwargs)
+        self.executor = executor
+        self.restored = False
+        self._models: dict[str, tuple[ModelName, int | None, Any]] = {}
+        self._availability: tuple[bool, bool] | None = None
+
+    def async_add_executor_job(self, target: Callable, *args: Any) -> Future:
+        """Run blocking Leviton I/O on the config entry's own executor."""
+        return self.hass.loop.run_in_executor(self.executor, target, *args)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the entities bound to models that changed since last time.
+
+        Each changed model gets the update signal its entities already
+        listen on for pushes. Every listener is updated on the first data,
+        whenever the update succeeds after failing or vice versa, and once
+        live data replaces restored data, as that changes them all.
+        """
+        previous, self._models = self._models, _models(self.data)
+        availability = (self.last_update_success, self.restored)
+        if not previous or self._availability != availability:
+            self._availability = availability
+            super().async_update_listeners()
+            return
+        changed = [
+            signal
+            for signal in previous.keys() | self._models.keys()
+            if previous.get(signal) != self._models.get(signal)
+        ]
+        self.logger.debug("%s models of %s changed", len(changed), len(self._models))
+        for signal in changed:
+            model_name, model_id, _ = self._models.get(signal) or previous[signal]
+            async_dispatcher_send(
+                self.hass, signal, {"modelName": model_name, "modelId": model_id}
+            )
+
     async def _async_update_data(self) -> LevitonData:
         """Fetch the latest data from the source."""
         if self.update_method is None:
@@ -136,13 +200,161 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         CONF_SCAN_INTERVAL, data.get(CONF_SCAN_INTERVAL, ScanInterval.DEFAULT)
     )
     conf_timeout = options.get(CONF_TIMEOUT, data.get(CONF_TIMEOUT, Timeout.DEFAULT))
+    conf_retries = options.get(CONF_RETRIES, data.get(CONF_RETRIES, Retries.DEFAULT))
+    conf_hedge_requests = options.get(
+        CONF_HEDGE_REQUESTS, data.get(CONF_HEDGE_REQUESTS, DEFAULT_HEDGE_REQUESTS)
+    )
 
     conf_save_location = DEFAULT_SAVE_LOCATION if conf_save_responses else None
 
+    token_manager = LevitonTokenManager(
+        login_response=data.get(CONF_LOGIN_RESPONSE),
+        authorization=data[CONF_TOKEN],
+        user_id=data[CONF_ID],
+    )
+    credentials = (
+        {"email": data[CONF_EMAIL], "password": data[CONF_PASSWORD]}
+        if data.get(CONF_EMAIL) and data.get(CONF_PASSWORD)
+        else None
+    )
     api = LevitonAPI(
         save_location=conf_save_location,
         user_id=data[CONF_ID],
-        authorization=data[CONF_TOKEN],
+        credentials=credentials,
+        token_manager=token_manager,
+        retries=int(conf_retries),
+        hedge=conf_hedge_requests,
+        timeout=conf_timeout,
+        # Saving responses is the debug mode; keep them whole in memory too.
+        keep_raw=conf_save_responses,
+    )
+    executor = LevitonExecutor(thread_name_prefix=f"{DOMAIN}_{config_entry.entry_id}")
+    config_entry.async_on_unload(
+        lambda: executor.shutdown(wait=False, cancel_futures=True)
+    )
+
+    @callback
+    def async_token_updated(login_response: dict) -> None:
+        """Persist a token the REST client obtained and hand it to the WebSocket."""
+        hass.config_entries.async_update_entry(
+            entry=config_entry,
+            data={
+                **config_entry.data,
+                CONF_TOKEN: login_response["id"],
+                CONF_LOGIN_RESPONSE: login_response,
+            },
+        )
+        entry_data = hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {})
+        if websocket := entry_data.get(DATA_WEBSOCKET):
+            config_entry.async_create_task(hass, websocket.reconnect())
+        async_schedule_token_refresh()
+
+    # Re-login happens on an executor thread inside the REST client.
+    config_entry.async_on_unload(
+        token_manager.add_listener(
+            lambda login_response: hass.loop.call_soon_threadsafe(
+                async_token_updated, login_response
+            )
+        )
+    )
+
+    cancel_token_refresh: list[CALLBACK_TYPE] = []
+
+    async def async_refresh_token(_now) -> None:
+        """Log in again before the token lapses, off the request path."""
+        cancel_token_refresh.clear()
+        try:
+            result = await hass.loop.run_in_executor(executor, api.refresh_token)
+        except OSError as exception:
+            result = exception
+        if result == LoginResult.SUCCESS:
+            # A successful login reschedules via the token listener.
+            return
+        if result != LoginResult.UNAVAILABLE and not isinstance(result, OSError):
+            # Retrying a rejected login (a bad password, a 2FA code that is
+            # needed, a lockout) only counts toward Leviton's lockout.
+            _LOGGER.error(
+                "Proactive token refresh failed (%s); the current token is "
+                "used until it expires, then the account must be set up again",
+                result,
+            )
+            return
+        _LOGGER.warning(
+            "Proactive token refresh failed (%s); retrying in %s",
+            result,
+            TOKEN_REFRESH_RETRY,
+        )
+        cancel_token_refresh.append(
+            async_track_point_in_utc_time(
+                hass, async_refresh_token, dt_util.utcnow() + TOKEN_REFRESH_RETRY
+            )
+        )
+
+    @callback
+    def async_cancel_token_refresh() -> None:
+        while cancel_token_refresh:
+            cancel_token_refresh.pop()()
+
+    @callback
+    def async_schedule_token_refresh() -> None:
+        """Schedule a refresh shortly before the current token expires."""
+        async_cancel_token_refresh()
+        if not api.credentials or (refresh_at := token_manager.refresh_at) is None:
+            return
+        _LOGGER.debug("Leviton access token refresh scheduled for %s", refresh_at)
+        cancel_token_refresh.append(
+            async_track_point_in_utc_time(
+                hass, async_refresh_token, max(refresh_at, dt_util.utcnow())
+            )
+        )
+
+    async_schedule_token_refresh()
+    config_entry.async_on_unload(async_cancel_token_refresh)
+
+    cancel_prewarm: list[CALLBACK_TYPE] = []
+
+    async def async_prewarm(_now) -> None:
+        """Open a REST connection just before the next poll needs it."""
+        cancel_prewarm.clear()
+        await hass.loop.run_in_executor(executor, api.prewarm)
+
+    @callback
+    def async_cancel_prewarm() -> None:
+        while cancel_prewarm:
+            cancel_prewarm.pop()()
+
+    config_entry.async_on_unload(async_cancel_prewarm)
+
+    store = _async_get_store(hass, config_entry)
+
+    @callback
+    def async_snapshot() -> dict[str, Any]:
+        """Return what to store for the next startup."""
+        return {
+            CONF_RESIDENCES: conf_residences,
+            CONF_DEVICES: conf_devices,
+            "data": coordinator.data.as_dict(),
+        }
+
+    endpoints = _needed_endpoints(hass, config_entry)
+
+    @callback
+    def async_registry_updated(
+        _event: Event[er.EventEntityRegistryUpdatedData],
+    ) -> None:
+        """Track which residence endpoints enabled entities still need."""
+        needed = _needed_endpoints(hass, config_entry)
+        if needed != endpoints:
+            _LOGGER.debug("Residence endpoints polled: %s", sorted(map(str, needed)))
+            endpoints.clear()
+            endpoints.update(needed)
+
+    config_entry.async_on_unload(
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            async_registry_updated,
+            event_filter=_entity_availability_changed,
+        )
     )
 
     async def async_update_data() -> LevitonData:
@@ -151,13 +363,42 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         This is the place to pre-process the data to lookup tables
         so entities can quickly look up their data.
         """
+        async_cancel_prewarm()
+        previous = api.data
         try:
             async with timeout(conf_timeout):
-                return await hass.async_add_executor_job(api.update, conf_residences)
+                data = await hass.loop.run_in_executor(
+                    executor,
+                    partial(
+                        api.update,
+                        conf_residences,
+                        target_devices=conf_devices,
+                        endpoints=set(endpoints),
+                        on_residence=lambda residence: hass.loop.call_soon_threadsafe(
+                            async_residence_loaded, residence
+                        ),
+                    ),
+                )
         except LevitonException as exception:
             raise UpdateFailed(
                 f"Error communicating with API, Status: {exception.status_code}, Error Name: {exception.name}, Error Message: {exception.message}"
             ) from exception
+        finally:
+            cancel_prewarm.append(
+                async_call_later(
+                    hass,
+                    timedelta(minutes=conf_scan_interval) - PREWARM_LEAD,
+                    async_prewarm,
+                )
+            )
+        # An update that fails part way hands back the data it already had,
+        # with the residences it did complete swapped in.
+        if data is not previous:
+            if coordinator.restored:
+                _LOGGER.debug("Live data replaces what %s restored", coordinator.name)
+            coordinator.restored = False
+            store.async_delay_save(async_snapshot, STORAGE_SAVE_DELAY.total_seconds())
+        return data
 
     coordinator = LevitonDataUpdateCoordinator(
         hass=hass,
@@ -166,20 +407,50 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         name=f"Leviton Decora Smart Wi-Fi ({data[CONF_NAME]})",
         update_interval=timedelta(minutes=conf_scan_interval),
         update_method=async_update_data,
+        executor=executor,
     )
-    await coordinator.async_refresh()
+    snapshot = await store.async_load()
+    if (
+        snapshot is not None
+        and snapshot[CONF_RESIDENCES] == conf_residences
+        and snapshot[CONF_DEVICES] == conf_devices
+    ):
+        # Set up from the last good data until the live update lands.
+        _LOGGER.debug("Restoring %s from storage", coordinator.name)
+        coordinator.restored = True
+        coordinator.async_set_updated_data(api.restore(snapshot["data"]))
+    else:
+        # Filled in residence by residence as the first update brings them.
+        coordinator.data = LevitonData({"firmware": {}, "residences": []})
+
+    loaded: set[int] = set()
+
+    @callback
+    def async_residence_loaded(residence: Residence) -> None:
+        """Set up a configured residence the first time an update brings it.
+
+        Platforms add its entities on the announcement, while the rest of
+        the update is still in flight.
+        """
+        if residence.id not in conf_residences or residence.id in loaded:
+            return
+        loaded.add(residence.id)
+        _async_add_residence_device(device_registry, config_entry, residence)
+        if residence.id not in [known.id for known in coordinator.data.residences]:
+            coordinator.data.residences.append(residence)
+        entry_data = hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {})
+        if websocket := entry_data.get(DATA_WEBSOCKET):
+            websocket.set_subscriptions(
+                _collect_subscriptions(coordinator, conf_residences, conf_devices)
+            )
+        async_dispatcher_send(
+            hass, f"{RESIDENCE_NOTIFICATION}_{config_entry.entry_id}", residence
+        )
 
     for residence in coordinator.data.residences:
         if residence.id in conf_residences:
-            device_registry.async_get_or_create(
-                config_entry_id=config_entry.entry_id,
-                configuration_url=CONFIGURATION_URL,
-                entry_type=dr.DeviceEntryType.SERVICE,
-                identifiers={(DOMAIN, str(residence.id))},
-                manufacturer=DEVICE_INFO_MANUFACTURER,
-                model=DEVICE_INFO_MODEL_RESIDENCE,
-                name=residence.name,
-            )
+            loaded.add(residence.id)
+            _async_add_residence_device(device_registry, config_entry, residence)
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][config_entry.entry_id] = {
@@ -187,19 +458,27 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         CONF_DEVICES: conf_devices,
         DATA_API: api,
         DATA_COORDINATOR: coordinator,
+        DATA_OPTIONS: dict(options),
         UNDO_UPDATE_LISTENER: config_entry.add_update_listener(async_update_listener),
     }
 
     websocket = await _async_start_websocket(
         hass,
         config_entry,
+        api,
         coordinator,
         conf_residences,
         conf_devices,
+        conf_timeout,
     )
     if websocket is not None:
         hass.data[DOMAIN][config_entry.entry_id][DATA_WEBSOCKET] = websocket
 
+    # Go to the cloud in the background, so a slow or unreachable cloud
+    # doesn't hold up boot; residences are set up as they come in.
+    config_entry.async_create_background_task(
+        hass, coordinator.async_refresh(), f"{coordinator.name} refresh"
+    )
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
     return True
@@ -208,60 +487,145 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 async def _async_start_websocket(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
+    api: LevitonAPI,
     coordinator: LevitonDataUpdateCoordinator,
     conf_residences: list[int],
     conf_devices: list[int],
+    conf_timeout: int,
 ) -> LevitonWebSocket | None:
-    """Open the MyLeviton WebSocket using the bearer already in config.
+    """Open the MyLeviton WebSocket using the token shared with the REST client.
 
     We deliberately do NOT call ``LevitonAPI.login`` from this path:
     each re-login attempt counts toward Leviton's "too many failed
     attempts" lockout, and a flapping WebSocket will burn through them.
-    Instead we synthesize the token payload from the bearer + user id
-    already persisted in the config entry. If that auth fails the WebSocket
-    client backs off ``AUTH_FAILURE_COOLDOWN`` (1h) before any retry.
+    Instead the WebSocket authenticates with whatever token the REST
+    client currently holds; when the REST client logs in again the
+    WebSocket is reconnected with the new token. If auth fails the
+    WebSocket client backs off ``AUTH_FAILURE_COOLDOWN`` (1h) before any
+    retry.
     """
-    bearer = config_entry.data.get(CONF_TOKEN)
-    user_id = config_entry.data.get(CONF_ID)
-    if not bearer or not user_id:
+    token_manager = api.token_manager
+    if token_manager.token is None:
         _LOGGER.warning("Leviton WebSocket disabled: bearer/user id missing")
         return None
 
     @callback
     def token_provider() -> dict | None:
-        # Re-read from config_entry on every reconnect so a re-auth via
-        # the options flow propagates without an HA restart. Prefer the
-        # full login response object captured at config-flow time — the
-        # cloud's WebSocket auth historically needs the entire response, not
-        # just the bearer + user id.
-        full = config_entry.data.get(CONF_LOGIN_RESPONSE)
-        if isinstance(full, dict) and full.get("id"):
-            return full
-        current = config_entry.data.get(CONF_TOKEN)
-        uid = config_entry.data.get(CONF_ID)
-        if not current or not uid:
-            return None
-        return {"id": current, "userId": uid}
+        return token_manager.token
+
+    @callback
+    def merge_model_data(model_name: str, model_id: int, data: dict) -> int | None:
+        """Merge pushed fields into the matching model.
+
+        Only keys the model already has are taken, and nested collections
+        (a residence's devices, a room's scenes, ...) are left to the poll.
+        Returns the id of the residence the model belongs to.
+        """
+        for residence in coordinator.data.residences:
+            if residence.id not in conf_residences:
+                continue
+            if model_name == ModelName.IOT_SWITCH:
+                targets = [
+                    device for device in residence.devices if device.id in conf_devices
+                ]
+            elif model_name == ModelName.RESIDENCE:
+                targets = [residence]
+            elif model_name == ModelName.ROOM:
+                targets = residence.rooms
+            elif model_name == ModelName.SCENE:
+                targets = [scene for room in residence.rooms for scene in room.scenes]
+            elif model_name == ModelName.SCHEDULE:
+                targets = residence.schedules
+            elif model_name == ModelName.ACTIVITY:
+                targets = residence.activities
+            else:
+                return None
+            for target in targets:
+                if target.id == model_id:
+                    target.data.update(
+                        {
+                            key: value
+                            for key, value in data.items()
+                            if key in target.data
+                            and not isinstance(target.data[key], list)
+                        }
+                    )
+                    return residence.id
+        return None
 
     @callback
     def on_notification(notification: dict) -> None:
         if model_id := notification.get("modelId"):
-            for residence in coordinator.data.residences:
-                if residence.id in conf_residences:
-                    for device in residence.devices:
-                        if device.id in conf_devices and device.id == model_id:
-                            data = notification.get("data", {})
-                            device.data.update(
-                                {
-                                    key: value
-                                    for key, value in data.items()
-                                    if key in device.data
-                                }
-                            )
+            model_name = notification.get("modelName", ModelName.IOT_SWITCH)
+            residence_id = merge_model_data(
+                model_name, model_id, notification.get("data", {})
+            )
             hass.bus.async_fire(EVENT_NOTIFICATION, notification)
+            if model_name == ModelName.IOT_SWITCH:
+                async_dispatcher_send(
+                    hass, f"{UPDATE_NOTIFICATION}_{model_id}", notification
+                )
+                return
             async_dispatcher_send(
-                hass, f"{UPDATE_NOTIFICATION}_{model_id}", notification
+                hass, f"{UPDATE_NOTIFICATION}_{model_name}_{model_id}", notification
             )
+            # Residence-level entities (home/away activity selects, ...)
+            # derive their state from the residence's rooms, schedules and
+            # activities, so let them know something underneath changed.
+            if residence_id is not None and model_name != ModelName.RESIDENCE:
+                async_dispatcher_send(
+                    hass,
+                    f"{UPDATE_NOTIFICATION}_{ModelName.RESIDENCE}_{residence_id}",
+                    notification,
+                )
+
+    async def on_reconnect(subscriptions: list[tuple[str, int]]) -> None:
+        """Refresh the subscribed switches after the WebSocket reconnects.
+
+        Pushes sent while the socket was down are lost, so fetch just the
+        subscribed IotSwitch models rather than waiting on the next full
+        poll. The result is merged and announced like a notification, but
+        not fired on the bus since nothing was actually pushed.
+        """
+        if coordinator.data is None:
+            return
+        device_ids = {
+            model_id
+            for model_name, model_id in subscriptions
+            if model_name == ModelName.IOT_SWITCH
+        }
+        for residence in coordinator.data.residences:
+            if residence.id not in conf_residences:
+                continue
+            residence_device_ids = [
+                device.id for device in residence.devices if device.id in device_ids
+            ]
+            if not residence_device_ids:
+                continue
+            try:
+                async with timeout(conf_timeout):
+                    devices = await coordinator.async_add_executor_job(
+                        api.get_devices, residence.id, residence_device_ids
+                    )
+            except LevitonException, TimeoutError:
+                _LOGGER.debug(
+                    "Leviton WebSocket: resync of residence %s failed; "
+                    "waiting for the next poll",
+                    residence.id,
+                )
+                continue
+            for data in devices:
+                if (model_id := data.get("id")) in device_ids:
+                    merge_model_data(ModelName.IOT_SWITCH, model_id, data)
+                    async_dispatcher_send(
+                        hass,
+                        f"{UPDATE_NOTIFICATION}_{model_id}",
+                        {
+                            "modelName": ModelName.IOT_SWITCH,
+                            "modelId": model_id,
+                            "data": data,
+                        },
+                    )
 
     subs = _collect_subscriptions(coordinator, conf_residences, conf_devices)
     _LOGGER.debug(
@@ -271,12 +635,129 @@ async def _async_start_websocket(
         session=async_get_clientsession(hass),
         token_provider=token_provider,
         on_notification=on_notification,
+        on_reconnect=on_reconnect,
     )
     websocket.set_subscriptions(subs)
     websocket.start()
     return websocket
 
 
+def _models(data: LevitonData | None) -> dict[str, tuple[ModelName, int | None, Any]]:
+    """Map the update signal of each model to its name, id and state.
+
+    The state is what the entities on that signal render: a switch with
+    its firmware, a schedule or an activity, for each scene its room, and
+    for a residence everything but its switches.
+    """
+    models: dict[str, tuple[ModelName, int | None, Any]] = {}
+    if data is None:
+        return models
+    for residence in data.residences:
+        for device in residence.devices:
+            firmware = data.firmware.get(device.model) if device.model else None
+            models[f"{UPDATE_NOTIFICATION}_{device.id}"] = (
+                ModelName.IOT_SWITCH,
+                device.id,
+                (device.data, firmware.data if firmware else None),
+            )
+        for room in residence.rooms:
+            for scene in room.scenes:
+                models[f"{UPDATE_NOTIFICATION}_{ModelName.SCENE}_{scene.id}"] = (
+                    ModelName.SCENE,
+                    scene.id,
+                    room.data,
+                )
+        for schedule in residence.schedules:
+            models[f"{UPDATE_NOTIFICATION}_{ModelName.SCHEDULE}_{schedule.id}"] = (
+                ModelName.SCHEDULE,
+                schedule.id,
+                schedule.data,
+            )
+        for activity in residence.activities:
+            models[f"{UPDATE_NOTIFICATION}_{ModelName.ACTIVITY}_{activity.id}"] = (
+                ModelName.ACTIVITY,
+                activity.id,
+                activity.data,
+            )
+        models[f"{UPDATE_NOTIFICATION}_{ModelName.RESIDENCE}_{residence.id}"] = (
+            ModelName.RESIDENCE,
+            residence.id,
+            {key: value for key, value in residence.data.items() if key != "devices"},
+        )
+    return models
+
+
+@callback
+def _async_add_residence_device(
+    device_registry: dr.DeviceRegistry,
+    config_entry: ConfigEntry,
+    residence: Residence,
+) -> None:
+    """Register the service device a residence's devices are linked via."""
+    device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        configuration_url=CONFIGURATION_URL,
+        entry_type=dr.DeviceEntryType.SERVICE,
+        identifiers={(DOMAIN, str(residence.id))},
+        manufacturer=DEVICE_INFO_MANUFACTURER,
+        model=DEVICE_INFO_MODEL_RESIDENCE,
+        name=residence.name,
+    )
+
+
+@callback
+def _entity_availability_changed(
+    event_data: er.EventEntityRegistryUpdatedData,
+) -> bool:
+    """Return whether a registry change can alter the endpoints polled."""
+    return event_data["action"] != "update" or "disabled_by" in event_data.get(
+        "changes", {}
+    )
+
+
+def _entity_endpoints(entity_entry: er.RegistryEntry) -> tuple[ResidenceEndpoint, ...]:
+    """Return the residence endpoints an entity's state and device read.
+
+    Device entities are keyed by MAC address and come from ``iotswitches``,
+    with their device's area from the room names of ``residentialrooms``;
+    residence entities are keyed by the numeric residence id, followed by
+    the activity, schedule or room and scene they expose.
+    """
+    residence_id, _, key = str(entity_entry.unique_id).partition("-")
+    if not residence_id.isdigit():
+        return (ResidenceEndpoint.DEVICES, ResidenceEndpoint.ROOMS)
+    if entity_entry.domain == Platform.SCENE:
+        return (ResidenceEndpoint.ROOMS,)
+    if key in ("away_activity", "home_activity"):
+        return (ResidenceEndpoint.ACTIVITIES,)
+    if key.isdigit() and entity_entry.domain == Platform.BUTTON:
+        return (ResidenceEndpoint.ACTIVITIES,)
+    if key.isdigit() and entity_entry.domain == Platform.SWITCH:
+        return (ResidenceEndpoint.SCHEDULES,)
+    return ()
+
+
+def _needed_endpoints(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> set[ResidenceEndpoint]:
+    """Return the residence endpoints the config entry's entities read.
+
+    An endpoint is dropped only once every entity registered against it is
+    disabled, so a fresh setup (nothing registered yet) fetches everything
+    and the entities get created.
+    """
+    enabled: dict[ResidenceEndpoint, bool] = {}
+    for entity_entry in er.async_entries_for_config_entry(
+        er.async_get(hass), config_entry.entry_id
+    ):
+        for endpoint in _entity_endpoints(entity_entry):
+            enabled[endpoint] = enabled.get(endpoint, False) or not (
+                entity_entry.disabled
+            )
+    enabled[ResidenceEndpoint.DEVICES] = True
+    return {endpoint for endpoint in ResidenceEndpoint if enabled.get(endpoint, True)}
+
+
 def _collect_subscriptions(
     coordinator: LevitonDataUpdateCoordinator,
     conf_residences: list[int],
@@ -287,6 +768,10 @@ def _collect_subscriptions(
     Empirically the cloud delivers physical button presses on the parent
     IotSwitch as ``data.btnPress: [{button: N, trigger: T}]`` — there is
     no separate IotButton push channel, so we don't subscribe to one.
+
+    Residence-level models (the residence itself for home/away, its rooms,
+    scenes, schedules and activities) are subscribed too, so edits made in
+    the app show up without waiting for the next poll.
     """
     subscriptions: list[tuple[str, int]] = []
     data: LevitonData | None = coordinator.data
@@ -295,10 +780,22 @@ def _collect_subscriptions(
     for residence in data.residences:
         if residence.id in conf_residences:
             subscriptions.extend(
-                ("IotSwitch", device.id)
+                (ModelName.IOT_SWITCH, device.id)
                 for device in residence.devices
                 if device.id in conf_devices
             )
+            subscriptions.append((ModelName.RESIDENCE, residence.id))
+            for room in residence.rooms:
+                subscriptions.append((ModelName.ROOM, room.id))
+                subscriptions.extend(
+                    (ModelName.SCENE, scene.id) for scene in room.scenes
+                )
+            subscriptions.extend(
+                (ModelName.SCHEDULE, schedule.id) for schedule in residence.schedules
+            )
+            subscriptions.extend(
+                (ModelName.ACTIVITY, activity.id) for activity in residence.activities
+            )
 
     return subscriptions
 
@@ -314,11 +811,29 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         entry_data[UNDO_UPDATE_LISTENER]()
         if websocket := entry_data.get(DATA_WEBSOCKET):
             await websocket.stop()
+        await hass.async_add_executor_job(entry_data[DATA_API].close)
         hass.data[DOMAIN].pop(config_entry.entry_id)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove the data stored for a config entry."""
+    await _async_get_store(hass, config_entry).async_remove()
+
+
+@callback
+def _async_get_store(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> Store[dict[str, Any]]:
+    """Return the store holding a config entry's last good data."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}")
+
+
 async def async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Handle options update."""
+    entry_data = hass.data.get(DOMAIN, {}).get(config_entry.entry_id)
+    if entry_data is not None and entry_data[DATA_OPTIONS] == config_entry.options:
+        # Only the data changed, e.g. a rotated token was persisted.
+        return
     await hass.config_entries.async_reload(config_entry.entry_id)
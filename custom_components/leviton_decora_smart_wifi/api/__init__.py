@@ -1,17 +1,48 @@
 """Leviton API."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import partial
 from http import HTTPMethod
 import json
 import logging
 from pathlib import Path
+import threading
+import time
 from typing import Any
 
 import requests
 
-from .const import API_ENDPOINT, FIRMWARE_APP_MAP, FirmwareAppID, LoginResult
+from .adapter import LevitonHTTPAdapter, endpoint
+from .auth import LevitonTokenManager
+from .const import (
+    ACTIVITY_FIELDS,
+    ACTIVITY_SCHEMA,
+    API_ENDPOINT,
+    CALL_TIMEOUT,
+    CONNECT_TIMEOUT,
+    DEVICE_FIELDS,
+    DEVICE_SCHEMA,
+    FIRMWARE_APP_MAP,
+    FIRMWARE_SCHEMA,
+    FULL_UPDATE_INTERVAL,
+    RESIDENCE_SCHEMA,
+    ROOM_FIELDS,
+    ROOM_SCHEMA,
+    SCHEDULE_FIELDS,
+    SCHEDULE_SCHEMA,
+    FirmwareAppID,
+    LoginResult,
+    RequestPriority,
+    ResidenceEndpoint,
+)
 from .firmware import Firmware
+from .hedge import LevitonHedger
+from .ratelimit import LevitonRateLimiter, parse_retry_after
 from .residence import Residence
+from .retry import DEFAULT_RETRIES, LevitonCircuitBreaker, LevitonRetryPolicy
+from .scheduler import LevitonRequestScheduler
+from .util import project, response_json
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,6 +64,15 @@ class LevitonData:
         """Residences."""
         return self.data.get("residences", [])
 
+    def as_dict(self) -> dict[str, Any]:
+        """Return the responses the snapshot was built from, for storage."""
+        return {
+            "firmware": {
+                model: firmware.data for model, firmware in self.firmware.items()
+            },
+            "residences": [residence.data for residence in self.residences],
+        }
+
 
 class LevitonException(Exception):
     """LevitonException."""
@@ -48,6 +88,18 @@ class LevitonException(Exception):
         )
 
 
+class DeadlineExceeded(LevitonException):
+    """A call did not complete within its deadline."""
+
+    def __init__(self, url: str) -> None:
+        """Initialize."""
+        super().__init__(
+            status_code=408,
+            name="DeadlineExceeded",
+            message=f"No response for {url} within the deadline",
+        )
+
+
 class LevitonAPI:
     """LevitonAPI."""
 
@@ -56,17 +108,70 @@ class LevitonAPI:
         authorization: str | None = None,
         save_location: str | None = None,
         user_id: str | None = None,
+        credentials: dict[str, str] | None = None,
+        token_manager: LevitonTokenManager | None = None,
+        retries: int = DEFAULT_RETRIES,
+        hedge: bool = False,
+        timeout: float = CALL_TIMEOUT,
+        keep_raw: bool = False,
     ) -> None:
         """Initialize."""
-        self.authorization = authorization
         self.save_location = save_location
+        self.keep_raw = keep_raw
+        self.timeout = timeout
         self.user_id = user_id
+        self.token_manager = token_manager or LevitonTokenManager(
+            authorization=authorization, user_id=user_id
+        )
 
-        self.credentials: dict = {}
+        self.credentials: dict = credentials or {}
         self.data: LevitonData = LevitonData()
-        self.session = requests.Session()
+        self.adapter = LevitonHTTPAdapter()
+        self.scheduler = LevitonRequestScheduler()
+        self.rate_limiter = LevitonRateLimiter()
+        self.retry_policy = LevitonRetryPolicy(retries=retries)
+        self.circuit_breaker = LevitonCircuitBreaker()
+        self.hedger = LevitonHedger() if hedge else None
+        self.session = self.new_session()
         self.user_name: str | None = None
-        self.login_response: dict[str, Any] | None = None
+        self.last_full_update: float | None = None
+        self.residence_accounts: dict[int, int] | None = None
+
+        self._login_lock = threading.Lock()
+        self._login_generation = 0
+        self._login_result = LoginResult.FAILED
+        self._session_lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def authorization(self) -> str | None:
+        """Authorization."""
+        return self.token_manager.authorization
+
+    @property
+    def login_response(self) -> dict[str, Any] | None:
+        """Login response."""
+        return self.token_manager.login_response
+
+    @contextmanager
+    def deadline(self, seconds: float) -> Iterator[None]:
+        """Make the calls of the calling thread finish within ``seconds``.
+
+        A nested deadline never extends the one around it.
+        """
+        previous = getattr(self._local, "deadline", None)
+        deadline = time.monotonic() + seconds
+        self._local.deadline = deadline if previous is None else min(previous, deadline)
+        try:
+            yield
+        finally:
+            self._local.deadline = previous
+
+    def remaining(self) -> float:
+        """Seconds left before the calling thread's deadline."""
+        if (deadline := getattr(self._local, "deadline", None)) is None:
+            return self.timeout
+        return deadline - time.monotonic()
 
     def call(
         self,
@@ -78,14 +183,56 @@ class LevitonAPI:
         """Call."""
         if headers is None:
             headers = {}
-        if self.authorization:
-            headers["authorization"] = self.authorization
-        _LOGGER.debug("Calling API with method: %s and URL: %s", method, url)
-        response = self.refresh(
-            lambda: self.session.request(
-                method=method, url=f"{API_ENDPOINT}/{url}", headers=headers, **kwargs
-            )
-        )
+
+        with self.deadline(self.timeout):
+            deadline = self._local.deadline
+
+            def request() -> requests.Response:
+                # Read the token per attempt so a retry after re-login uses it.
+                if self.authorization:
+                    headers["authorization"] = self.authorization
+                if not self.rate_limiter.acquire(timeout=deadline - time.monotonic()):
+                    raise DeadlineExceeded(url)
+                # Hedged copies run on other threads, hence the captured
+                # deadline rather than remaining().
+                if (remaining := deadline - time.monotonic()) <= 0:
+                    raise DeadlineExceeded(url)
+                return self.session.request(
+                    method=method,
+                    url=f"{API_ENDPOINT}/{url}",
+                    headers=headers,
+                    timeout=(min(CONNECT_TIMEOUT, remaining), remaining),
+                    **kwargs,
+                )
+
+            attempt = request
+            if self.hedger and method in (HTTPMethod.GET, HTTPMethod.PUT):
+                priority = self.scheduler.current_priority
+
+                def copy() -> requests.Response:
+                    # A hedged copy needs a slot of its own; it isn't sent
+                    # when none is free right away.
+                    with (
+                        self.scheduler.priority(priority),
+                        self.scheduler.slot(timeout=0),
+                    ):
+                        return request()
+
+                attempt = partial(
+                    self.hedger.run,
+                    f"{method} {endpoint(f'{API_ENDPOINT}/{url}')}",
+                    request,
+                    copy,
+                )
+
+            _LOGGER.debug("Calling API with method: %s and URL: %s", method, url)
+            try:
+                with self.scheduler.slot(timeout=max(0.0, self.remaining())):
+                    response = self.refresh(
+                        attempt, idempotent=method == HTTPMethod.GET
+                    )
+            except TimeoutError as exception:
+                raise DeadlineExceeded(url) from exception
         response = self.parse_response(response=response)
         self.save_response(response=response, name=url)
         return response
@@ -103,13 +250,12 @@ class LevitonAPI:
                 data=data,
             )
             if response and isinstance(response, dict):
-                self.authorization = response["id"]
                 self.user_id = response["user"]["id"]
                 self.user_name = "{} {}".format(
                     response["user"]["firstName"],
                     response["user"]["lastName"],
                 )
-                self.login_response = response
+                self.token_manager.update(response)
         except LevitonException as exception:
             if all(
                 [
@@ -140,13 +286,98 @@ class LevitonAPI:
                 ]
             ):
                 return LoginResult.CODE_INVALID
+            if exception.status_code in (408, 429) or (
+                isinstance(exception.status_code, int) and exception.status_code >= 500
+            ):
+                return LoginResult.UNAVAILABLE
             return LoginResult.FAILED
         self.credentials = data
         return LoginResult.SUCCESS
 
+    def refresh_token(self, stale_authorization: str | None = None) -> LoginResult:
+        """Log in again with the stored credentials to obtain a fresh token.
+
+        Single-flight: concurrent callers wait for the login already in
+        progress and share its result rather than each logging in, which
+        would count toward Leviton's "too many failed attempts" lockout.
+        ``stale_authorization`` is the token a failed request was sent
+        with; if it has been replaced since, no login is needed at all.
+        A 401 on the login request itself doesn't log in again.
+        """
+        if not self.credentials or getattr(self._local, "logging_in", False):
+            return LoginResult.FAILED
+        generation = self._login_generation
+        with self._login_lock:
+            if self._login_generation != generation:
+                return self._login_result
+            if (
+                stale_authorization is not None
+                and stale_authorization != self.authorization
+            ):
+                return LoginResult.SUCCESS
+            self._local.logging_in = True
+            try:
+                self._login_result = self.login(
+                    email=self.credentials["email"],
+                    password=self.credentials["password"],
+                    code=self.credentials.get("code"),
+                )
+            finally:
+                self._local.logging_in = False
+            self._login_generation += 1
+            return self._login_result
+
+    def new_session(self) -> requests.Session:
+        """Create a session whose API requests go through the managed pool."""
+        session = requests.Session()
+        session.mount(API_ENDPOINT, self.adapter)
+        return session
+
+    def rotate_session(self, stale_session: requests.Session) -> None:
+        """Replace the session, unless another thread already has."""
+        with self._session_lock:
+            if self.session is stale_session:
+                _LOGGER.debug(
+                    "Leviton REST connection dropped; retrying with fresh session"
+                )
+                self.adapter.clear()
+                self.session = self.new_session()
+
+    def close(self) -> None:
+        """Release connections and worker threads."""
+        if self.hedger:
+            self.hedger.shutdown()
+        self.session.close()
+
+    def prewarm(self) -> None:
+        """Open a connection ahead of a scheduled poll.
+
+        Sends a HEAD through the session, so the connection lands in the
+        pool the poll will use; the response itself is ignored.
+        """
+        try:
+            self.session.head(API_ENDPOINT, timeout=(CONNECT_TIMEOUT, CONNECT_TIMEOUT))
+        except OSError:
+            _LOGGER.debug("Failed to pre-warm REST connection", exc_info=True)
+            return
+        self.adapter.prewarms += 1
+
     def parse_response(self, response: requests.Response) -> dict[str, Any] | None:
         """Parse the response."""
-        text = json.loads(response.text)
+        if response.status_code == 429:
+            raise LevitonException(
+                status_code=429,
+                name="TooManyRequests",
+                message="Rate limited by the Leviton API",
+            )
+        try:
+            text = response_json(response)
+        except ValueError as exception:
+            raise LevitonException(
+                status_code=response.status_code,
+                name="InvalidResponse",
+                message=f"Response is not valid JSON: {exception}",
+            ) from exception
         if response.status_code != 200:
             error = text["error"]
             raise LevitonException(
@@ -156,39 +387,113 @@ class LevitonAPI:
             )
         return text
 
-    def refresh(self, function: Callable) -> requests.Response:
-        """Refresh login authorization, retrying once on a stale connection.
+    def send(self, function: Callable, idempotent: bool = False) -> requests.Response:
+        """Send a request, retrying transient failures.
 
         Leviton's REST endpoint silently closes pooled keep-alive
         connections; the next request on a stale connection fails with
-        ``ConnectionError``/``RemoteDisconnected`` and HA marks every
-        coordinator-bound entity unavailable until the next cycle. Retry
-        once after rotating the requests.Session so the client gets a
-        fresh socket.
+        ``ConnectionError``/``RemoteDisconnected``. The adapter evicts
+        connections idle past the observed keep-alive, so this should be
+        rare; when it still happens, the request is retried once after
+        rotating the requests.Session so the client gets a fresh socket.
+
+        Idempotent requests are additionally retried with jittered
+        exponential backoff on transport errors and 5xx responses. The
+        outcome feeds the circuit breaker, which fast-fails requests while
+        the backend is down instead of waiting out every timeout. A
+        transport error that is not retried any more is raised as a
+        ``DeadlineExceeded`` for timeouts, a ``LevitonException`` otherwise.
         """
-        try:
-            response = function()
-        except requests.exceptions.ConnectionError:
-            _LOGGER.debug(
-                "Leviton REST connection dropped; retrying with fresh session"
+        if (remaining := self.circuit_breaker.allow()) is not None:
+            raise LevitonException(
+                status_code=503,
+                name="CircuitOpen",
+                message=f"Leviton API unavailable, retrying in {remaining:.0f}s",
             )
-            self.session = requests.Session()
-            response = function()
-        if response.status_code != 200:
-            text = json.loads(response.text)
-            error = text["error"]
+        retries = self.retry_policy.retries if idempotent else 0
+        attempt = 0
+        while True:
+            session = self.session
+            try:
+                response = function()
+            except requests.exceptions.RequestException as exception:
+                if isinstance(exception, requests.exceptions.ConnectionError):
+                    self.rotate_session(session)
+                    limit = max(retries, 1)
+                else:
+                    limit = retries
+                if (delay := self.retry_delay(attempt, limit)) is None:
+                    self.circuit_breaker.record_failure()
+                    if isinstance(exception, requests.exceptions.Timeout):
+                        url = getattr(exception.request, "url", None) or "request"
+                        raise DeadlineExceeded(url) from exception
+                    raise LevitonException(
+                        status_code=503,
+                        name=type(exception).__name__,
+                        message=str(exception),
+                    ) from exception
+            except BaseException:
+                # Not the backend's doing (a deadline, say): don't count it,
+                # but let a later request be the trial if this one was.
+                self.circuit_breaker.release()
+                raise
+            else:
+                if response.status_code < 500:
+                    self.circuit_breaker.record_success()
+                    return response
+                if (delay := self.retry_delay(attempt, retries)) is None:
+                    self.circuit_breaker.record_failure()
+                    return response
+            attempt += 1
+            self.retry_policy.retried += 1
+            _LOGGER.debug("Retrying Leviton API request in %.2fs", delay)
+            time.sleep(delay)
+
+    def retry_delay(self, attempt: int, limit: int) -> float | None:
+        """Return the backoff before the next attempt.
+
+        None when the attempts are used up or the retry could not finish
+        before the deadline.
+        """
+        if attempt >= limit:
+            return None
+        delay = self.retry_policy.delay(attempt + 1)
+        if delay >= self.remaining():
+            return None
+        return delay
+
+    def refresh(
+        self, function: Callable, idempotent: bool = False
+    ) -> requests.Response:
+        """Refresh login authorization and back off when rate limited."""
+        authorization = self.authorization
+        response = self.send(function, idempotent)
+        for retry in (True, False):
+            if response.status_code != 429:
+                break
+            # Wait out Retry-After (the limiter holds every request back
+            # until then) and try once more at the reduced rate.
+            self.rate_limiter.throttle(
+                parse_retry_after(response.headers.get("Retry-After"))
+            )
+            if not retry:
+                return response
+            response = self.send(function, idempotent)
+        if 200 <= response.status_code < 300:
+            self.rate_limiter.record_success()
+        if response.status_code == 401:
+            try:
+                error = response_json(response)["error"]
+            except ValueError, KeyError, TypeError:
+                error = {}
             if all(
                 [
-                    response.status_code == 401,
-                    error["message"] == "Invalid Access Token",
+                    error.get("message") == "Invalid Access Token",
+                    self.credentials,
                 ]
             ):
-                self.login(
-                    email=self.credentials["email"],
-                    password=self.credentials["password"],
-                    code=self.credentials.get("code"),
-                )
-                response = function()
+                self.refresh_token(stale_authorization=authorization)
+                response = self.send(function, idempotent)
         return response
 
     def save_response(
@@ -212,22 +517,141 @@ class LevitonAPI:
                 )
             file.close()
 
-    def update(self, target_residences: list[int] | None = None) -> LevitonData:
-        """Update."""
+    def project(self, data: Any, schema: dict[str, Any], full: bool = False) -> Any:
+        """Keep only what the models read of a response.
+
+        Raw and full-update responses are kept whole, so the hourly full
+        update still carries every attribute.
+        """
+        return data if self.keep_raw or full else project(data, schema)
+
+    @property
+    def full_update_due(self) -> bool:
+        """Whether the next update should fetch every attribute."""
+        return (
+            self.last_full_update is None
+            or time.monotonic() - self.last_full_update >= FULL_UPDATE_INTERVAL
+        )
+
+    def update(
+        self,
+        target_residences: list[int] | None = None,
+        full: bool | None = None,
+        target_devices: list[int] | None = None,
+        endpoints: set[ResidenceEndpoint] | None = None,
+        on_residence: Callable[[Residence], None] | None = None,
+    ) -> LevitonData:
+        """Update.
+
+        Full updates fetch every attribute; the ones in between only what
+        the models read. ``full`` defaults to whether one is due. With
+        ``target_devices``, only those switches are fetched; with
+        ``endpoints``, only those endpoints of each residence.
+        ``on_residence`` is called with each residence as it completes,
+        before the rest and the firmware are fetched. A failed update
+        returns the data it had, with the residences it did complete
+        swapped in; if it completed none, the error is raised.
+        """
+        if full is None:
+            full = self.full_update_due
+        residences: list[Residence] = []
         try:
-            data = {}
-            data["residences"] = self.get_residences(target_residences)
-            data["firmware"] = self.get_firmware(data["residences"])
-            self.data = LevitonData(data)
+            with (
+                self.scheduler.priority(RequestPriority.POLL),
+                self.deadline(self.timeout),
+            ):
+                for residence in self.get_residences(
+                    target_residences, full, target_devices, endpoints
+                ):
+                    residences.append(residence)
+                    if on_residence is not None:
+                        on_residence(residence)
+                firmware = self.get_firmware(residences)
+            self.data = LevitonData({"residences": residences, "firmware": firmware})
+            if full:
+                self.last_full_update = time.monotonic()
         except LevitonException:
+            if not residences:
+                raise
+            # Keep the residences that did complete; they have been
+            # handed to ``on_residence`` and may be in use already.
+            completed = {residence.id: residence for residence in residences}
+            self.data = LevitonData(
+                {
+                    "residences": [
+                        completed.pop(residence.id, residence)
+                        for residence in self.data.residences
+                    ]
+                    + list(completed.values()),
+                    "firmware": self.data.firmware,
+                }
+            )
             return self.data
         return self.data
 
+    def restore(self, data: dict[str, Any]) -> LevitonData:
+        """Restore a snapshot from ``LevitonData.as_dict``.
+
+        It becomes the data a failed update falls back to.
+        """
+        self.data = LevitonData(
+            {
+                "firmware": {
+                    model: Firmware(firmware)
+                    for model, firmware in data.get("firmware", {}).items()
+                },
+                "residences": [
+                    Residence(self, residence)
+                    for residence in data.get("residences", [])
+                ],
+            }
+        )
+        return self.data
+
     def get_residences(
-        self, target_residences: list[int] | None = None
-    ) -> list[Residence]:
-        """Get residences."""
-        data = []
+        self,
+        target_residences: list[int] | None = None,
+        full: bool = True,
+        target_devices: list[int] | None = None,
+        endpoints: set[ResidenceEndpoint] | None = None,
+    ) -> Iterator[Residence]:
+        """Get residences, yielding each one as soon as it is complete.
+
+        Full updates walk the person's permissions and accounts to find
+        the residences and remember which account each belongs to. Other
+        polls of known residences go straight to ``residences/{id}``; a
+        403 or 404 there sends the rest back through the walk.
+        """
+        known = self.residence_accounts
+        done: set[int] = set()
+        if (
+            not full
+            and known is not None
+            and target_residences is not None
+            and all(residence_id in known for residence_id in target_residences)
+        ):
+            try:
+                for residence_id in target_residences:
+                    yield self.get_residence(
+                        self.call(
+                            method=HTTPMethod.GET, url=f"residences/{residence_id}"
+                        ),
+                        full,
+                        target_devices,
+                        endpoints,
+                    )
+                    done.add(residence_id)
+                return
+            except LevitonException as exception:
+                if exception.status_code not in (403, 404):
+                    raise
+                _LOGGER.debug(
+                    "Residence lookup failed with %s; walking permissions again",
+                    exception.status_code,
+                )
+                self.residence_accounts = None
+
+        residence_accounts = {}
         permissions = self.call(
             method=HTTPMethod.GET,
             url=f"person/{self.user_id}/residentialpermissions",
@@ -243,41 +667,123 @@ class LevitonAPI:
                     for residence in residences:
                         if residence and isinstance(residence, dict):
                             residence_id = residence["id"]
-                            if any(
+                            residence_accounts[residence_id] = residential_account_id
+                            if residence_id not in done and any(
                                 [
                                     target_residences is None,
                                     target_residences
                                     and residence_id in target_residences,
                                 ]
                             ):
-                                residence["activities"] = self.call(
-                                    method=HTTPMethod.GET,
-                                    url=f"residences/{residence_id}/residentialactivities",
+                                yield self.get_residence(
+                                    residence, full, target_devices, endpoints
                                 )
-                                residence["devices"] = self.call(
-                                    method=HTTPMethod.GET,
-                                    url=f"residences/{residence_id}/iotswitches",
-                                    headers={
-                                        "filter": json.dumps(
-                                            obj={"include": ["iotButtons"]}
-                                        )
-                                    },
-                                )
-                                residence["rooms"] = self.call(
-                                    method=HTTPMethod.GET,
-                                    url=f"residences/{residence_id}/residentialrooms",
-                                    headers={
-                                        "filter": json.dumps(
-                                            obj={"include": ["residentialScenes"]}
-                                        )
-                                    },
-                                )
-                                residence["schedules"] = self.call(
-                                    method=HTTPMethod.GET,
-                                    url=f"residences/{residence_id}/residentialschedules",
-                                )
-                                data.append(Residence(self, residence))
-        return data
+        self.residence_accounts = residence_accounts
+
+    def get_residence(
+        self,
+        residence: dict[str, Any],
+        full: bool = True,
+        target_devices: list[int] | None = None,
+        endpoints: set[ResidenceEndpoint] | None = None,
+    ) -> Residence:
+        """Get the activities, switches, rooms and schedules of a residence.
+
+        Unless ``full``, they are fetched with a ``fields`` projection of
+        the attributes read. ``target_devices`` is pushed down into the
+        switch query, so the server only returns the switches managed.
+        Endpoints not in ``endpoints`` are skipped and left empty. Unless
+        ``full``, every response is projected to the attributes read before
+        it is kept.
+        """
+        residence = self.project(residence, RESIDENCE_SCHEMA, full)
+        residence_id = residence["id"]
+        device_query: dict[str, Any] = {"include": ["iotButtons"]}
+        if target_devices is not None:
+            device_query["where"] = {"id": {"inq": target_devices}}
+
+        def query(fields: tuple[str, ...], **kwargs: Any) -> dict[str, str]:
+            if not full:
+                kwargs["fields"] = dict.fromkeys(fields, True)
+            return {"filter": json.dumps(obj=kwargs)} if kwargs else {}
+
+        def needed(endpoint: ResidenceEndpoint) -> bool:
+            return endpoints is None or endpoint in endpoints
+
+        residence["activities"] = (
+            self.project(
+                self.call(
+                    method=HTTPMethod.GET,
+                    url=f"residences/{residence_id}/{ResidenceEndpoint.ACTIVITIES}",
+                    headers=query(ACTIVITY_FIELDS),
+                ),
+                ACTIVITY_SCHEMA,
+                full,
+            )
+            if needed(ResidenceEndpoint.ACTIVITIES)
+            else []
+        )
+        residence["devices"] = (
+            self.project(
+                self.call(
+                    method=HTTPMethod.GET,
+                    url=f"residences/{residence_id}/{ResidenceEndpoint.DEVICES}",
+                    headers=query(DEVICE_FIELDS, **device_query),
+                ),
+                DEVICE_SCHEMA,
+                full,
+            )
+            if needed(ResidenceEndpoint.DEVICES)
+            and (target_devices is None or target_devices)
+            else []
+        )
+        residence["rooms"] = (
+            self.project(
+                self.call(
+                    method=HTTPMethod.GET,
+                    url=f"residences/{residence_id}/{ResidenceEndpoint.ROOMS}",
+                    headers=query(ROOM_FIELDS, include=["residentialScenes"]),
+                ),
+                ROOM_SCHEMA,
+                full,
+            )
+            if needed(ResidenceEndpoint.ROOMS)
+            else []
+        )
+        residence["schedules"] = (
+            self.project(
+                self.call(
+                    method=HTTPMethod.GET,
+                    url=f"residences/{residence_id}/{ResidenceEndpoint.SCHEDULES}",
+                    headers=query(SCHEDULE_FIELDS),
+                ),
+                SCHEDULE_SCHEMA,
+                full,
+            )
+            if needed(ResidenceEndpoint.SCHEDULES)
+            else []
+        )
+        return Residence(self, residence)
+
+    def get_devices(
+        self, residence_id: int, device_ids: list[int]
+    ) -> list[dict[str, Any]]:
+        """Get devices.
+
+        Fetches only the requested switches of a residence in a single
+        request, for targeted refreshes that don't warrant a full update.
+        """
+        with self.scheduler.priority(RequestPriority.REFRESH):
+            devices = self.call(
+                method=HTTPMethod.GET,
+                url=f"residences/{residence_id}/iotswitches",
+                headers={
+                    "filter": json.dumps(obj={"where": {"id": {"inq": device_ids}}})
+                },
+            )
+        if devices and isinstance(devices, list):
+            return devices
+        return []
 
     def get_firmware(self, residences: list[Residence]) -> dict[str, Firmware]:
         """Get firmware."""
@@ -303,5 +809,7 @@ class LevitonAPI:
                 },
             )
             if app_firmware and isinstance(app_firmware, list):
-                firmware[model] = Firmware(app_firmware[0])
+                firmware[model] = Firmware(
+                    self.project(app_firmware[0], FIRMWARE_SCHEMA)
+                )
         return firmware
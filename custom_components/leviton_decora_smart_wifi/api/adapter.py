@@ -0,0 +1,185 @@
+"""Leviton API."""
+
+import logging
+import re
+import threading
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_LOGGER = logging.getLogger(__name__)
+
+# Leviton drops idle keep-alive connections without telling the client
+# and does not advertise how long it keeps them. Start from this guess
+# and shrink it whenever a reused connection turns out to be dead.
+DEFAULT_IDLE_TIMEOUT = 60.0
+MIN_IDLE_TIMEOUT = 5.0
+IDLE_TIMEOUT_SHRINK = 0.8
+
+KEEP_ALIVE_TIMEOUT = re.compile(r"timeout=(\d+)")
+
+ENDPOINT_ID = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint(url: str) -> str:
+    """Return the API path of ``url`` with ids replaced by ``{id}``."""
+    path = urlsplit(url).path.removeprefix("/api/")
+    return ENDPOINT_ID.sub("/{id}", path)
+
+
+class LevitonHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that evicts connections the server has likely dropped.
+
+    Tracks how long the pool has been idle and clears it before a request
+    once the idle time exceeds the server's observed keep-alive, so the
+    request opens a fresh connection instead of failing on a stale one.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize."""
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+        self._last_used: float | None = None
+        self.idle_timeout = DEFAULT_IDLE_TIMEOUT
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.prewarms = 0
+        self.transfers: dict[str, dict[str, Any]] = {}
+
+    def _evict_idle(self) -> float | None:
+        """Clear the pool if it sat idle too long; return the idle time."""
+        with self._lock:
+            if self._last_used is None:
+                return None
+            idle = time.monotonic() - self._last_used
+            if idle > self.idle_timeout:
+                _LOGGER.debug("Evicting REST connections idle for %.0fs", idle)
+                self.poolmanager.clear()
+                self._last_used = None
+                self.evictions += 1
+            return idle
+
+    def _touch(self) -> None:
+        with self._lock:
+            self._last_used = time.monotonic()
+
+    def _pool(
+        self,
+        request: requests.PreparedRequest,
+        verify: bool | str = True,
+        cert: Any = None,
+        proxies: dict[str, str] | None = None,
+    ) -> Any:
+        """Return the urllib3 pool ``send`` will use for this request."""
+        if hasattr(self, "get_connection_with_tls_context"):
+            return self.get_connection_with_tls_context(
+                request, verify, proxies=proxies, cert=cert
+            )
+        return self.get_connection(request.url, proxies)
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: bool | str = True,
+        cert: Any = None,
+        proxies: dict[str, str] | None = None,
+    ) -> requests.Response:
+        """Send a request, counting whether it reused a pooled connection."""
+        idle = self._evict_idle()
+        pool = self._pool(request, verify, cert, proxies)
+        connections = pool.num_connections
+        try:
+            response = super().send(
+                request,
+                stream=stream,
+                timeout=timeout,
+                verify=verify,
+                cert=cert,
+                proxies=proxies,
+            )
+        except requests.exceptions.ConnectionError:
+            if idle is not None and pool.num_connections == connections:
+                # A reused connection was already gone: the server's
+                # keep-alive is shorter than we thought.
+                self.idle_timeout = max(MIN_IDLE_TIMEOUT, idle * IDLE_TIMEOUT_SHRINK)
+                _LOGGER.debug(
+                    "Stale REST connection after %.0fs idle; idle timeout now %.0fs",
+                    idle,
+                    self.idle_timeout,
+                )
+            raise
+        with self._lock:
+            if pool.num_connections == connections:
+                self.hits += 1
+            else:
+                self.misses += 1
+            if match := KEEP_ALIVE_TIMEOUT.search(
+                response.headers.get("Keep-Alive", "")
+            ):
+                self.idle_timeout = max(MIN_IDLE_TIMEOUT, float(match.group(1)) - 1)
+        self._touch()
+        if not stream:
+            self._record_transfer(request, response)
+        return response
+
+    def _record_transfer(
+        self, request: requests.PreparedRequest, response: requests.Response
+    ) -> None:
+        """Count bytes received on the wire and after decompression.
+
+        urllib3 decompresses the body chunk by chunk as it is read, so
+        the compressed payload is never held in full.
+        """
+        body = len(response.content)
+        # Bytes pulled from the socket, before content decoding.
+        wire = response.raw.tell() if response.raw is not None else body
+        encoding = response.headers.get("Content-Encoding", "identity")
+        with self._lock:
+            transfer = self.transfers.setdefault(
+                endpoint(request.url or ""),
+                {"requests": 0, "wire_bytes": 0, "body_bytes": 0, "encodings": {}},
+            )
+            transfer["requests"] += 1
+            transfer["wire_bytes"] += wire
+            transfer["body_bytes"] += body
+            transfer["encodings"][encoding] = transfer["encodings"].get(encoding, 0) + 1
+
+    def clear(self) -> None:
+        """Drop every pooled connection."""
+        self.poolmanager.clear()
+        with self._lock:
+            self._last_used = None
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Pool statistics."""
+        requests_sent = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / requests_sent, 3) if requests_sent else None,
+            "evictions": self.evictions,
+            "prewarms": self.prewarms,
+            "idle_timeout": self.idle_timeout,
+        }
+
+    @property
+    def transfer_stats(self) -> dict[str, Any]:
+        """Bytes received per endpoint, compressed and uncompressed."""
+        with self._lock:
+            return {
+                name: {
+                    **transfer,
+                    "encodings": dict(transfer["encodings"]),
+                    "ratio": round(transfer["wire_bytes"] / transfer["body_bytes"], 3)
+                    if transfer["body_bytes"]
+                    else None,
+                }
+                for name, transfer in self.transfers.items()
+            }
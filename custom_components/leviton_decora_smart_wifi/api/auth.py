@@ -0,0 +1,107 @@
+"""Leviton API."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+import logging
+import threading
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Refresh the token this long before it expires, or after 90% of its
+# lifetime for short-lived tokens.
+REFRESH_MARGIN = timedelta(days=1)
+REFRESH_MARGIN_RATIO = 0.1
+
+
+class LevitonTokenManager:
+    """Access token shared by the REST client and the WebSocket.
+
+    The REST client replaces the token whenever it logs in again; the
+    listeners registered here are then called, from whatever thread did
+    the login, with the new login response.
+    """
+
+    def __init__(
+        self,
+        login_response: dict[str, Any] | None = None,
+        authorization: str | None = None,
+        user_id: str | None = None,
+    ) -> None:
+        """Initialize."""
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[dict[str, Any]], None]] = []
+        self.login_response = login_response
+        self.authorization = authorization
+        self.user_id = user_id
+        if login_response is not None:
+            self.authorization = login_response.get("id", authorization)
+            self.user_id = login_response.get("userId", user_id)
+
+    @property
+    def token(self) -> dict[str, Any] | None:
+        """Token payload for authenticating the WebSocket.
+
+        The cloud's WebSocket auth historically needs the entire login
+        response, so prefer it over a payload synthesized from the bearer
+        and user id.
+        """
+        with self._lock:
+            if self.login_response and self.login_response.get("id"):
+                return self.login_response
+            if not self.authorization or not self.user_id:
+                return None
+            return {"id": self.authorization, "userId": self.user_id}
+
+    @property
+    def expires_at(self) -> datetime | None:
+        """When the token expires, from the login response's ``created``/``ttl``."""
+        if not self.login_response:
+            return None
+        created = self.login_response.get("created")
+        ttl = self.login_response.get("ttl")
+        if not created or not isinstance(ttl, int) or ttl <= 0:
+            return None
+        try:
+            created_at = datetime.fromisoformat(created)
+        except ValueError:
+            return None
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=UTC)
+        return created_at + timedelta(seconds=ttl)
+
+    @property
+    def refresh_at(self) -> datetime | None:
+        """When the token should be refreshed ahead of its expiry."""
+        if (expires_at := self.expires_at) is None:
+            return None
+        ttl = timedelta(seconds=self.login_response["ttl"])
+        return expires_at - min(REFRESH_MARGIN, ttl * REFRESH_MARGIN_RATIO)
+
+    def update(self, login_response: dict[str, Any]) -> None:
+        """Replace the token with a fresh login response."""
+        with self._lock:
+            self.login_response = login_response
+            self.authorization = login_response["id"]
+            self.user_id = login_response.get("userId", self.user_id)
+            listeners = list(self._listeners)
+        _LOGGER.debug("Leviton access token replaced")
+        for listener in listeners:
+            try:
+                listener(login_response)
+            except Exception:
+                _LOGGER.exception("Token listener raised")
+
+    def add_listener(
+        self, listener: Callable[[dict[str, Any]], None]
+    ) -> Callable[[], None]:
+        """Call ``listener`` with every new login response."""
+        with self._lock:
+            self._listeners.append(listener)
+
+        def remove_listener() -> None:
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+
+        return remove_listener
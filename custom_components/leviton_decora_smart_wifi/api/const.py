@@ -4,6 +4,113 @@ from enum import IntEnum, StrEnum
 
 API_ENDPOINT = "https://my.leviton.com/api"
 
+# Seconds a call may take overall, and at most to open a connection.
+CALL_TIMEOUT = 30.0
+CONNECT_TIMEOUT = 5.0
+
+# Seconds between full updates; the polls in between only request the
+# attributes the models read (the *_FIELDS below).
+FULL_UPDATE_INTERVAL = 3600.0
+
+ACTIVITY_FIELDS = ("id", "isButtonActivity", "name", "onAwayId", "onHomeId")
+DEVICE_FIELDS = (
+    "autoOffTime",
+    "brightness",
+    "canSetLevel",
+    "connected",
+    "created",
+    "dimLED",
+    "downloaded",
+    "enableBuzzer",
+    "fadeOffTime",
+    "fadeOnTime",
+    "fault",
+    "id",
+    "iotBridgeId",
+    "iotBridgeSerial",
+    "isRandomEnabled",
+    "lastUpdated",
+    "lightEnable",
+    "loadType",
+    "localIP",
+    "mac",
+    "manufacturer",
+    "matterManualCode",
+    "matterQRCode",
+    "maxLevel",
+    "minLevel",
+    "model",
+    "motionAmbientThr",
+    "motionDisable",
+    "motionDisableTime",
+    "motionLED",
+    "motionMode",
+    "motionNightLevel",
+    "motionNightMode",
+    "motionOccupied",
+    "motionTimeout",
+    "name",
+    "otaStatus",
+    "power",
+    "presetLevel",
+    "residenceId",
+    "residentialRoomId",
+    "reversePhase",
+    "rssi",
+    "serial",
+    "smartBulbModeEnabled",
+    "statusLED",
+    "triacOff",
+    "version",
+)
+ROOM_FIELDS = ("allConnected", "id", "name", "power", "residenceId")
+SCHEDULE_FIELDS = ("disabled", "id", "name", "residenceId")
+
+# What is kept in memory of each response, unless raw responses are kept
+# for debugging: attribute names map to None, or to the schema of the
+# objects in the nested list they hold.
+BUTTON_FIELDS = ("configurationType", "id", "number", "text")
+FIRMWARE_FIELDS = ("enabled", "lcsAppId", "model", "notes", "version")
+RESIDENCE_FIELDS = (
+    "country",
+    "created",
+    "energyCost",
+    "geopoint",
+    "id",
+    "isAutoUpdateEnabled",
+    "isOnAwayActivityEnabled",
+    "isOnHomeActivityEnabled",
+    "isRandomEnabled",
+    "lastUpdated",
+    "locality",
+    "name",
+    "nightModeBegin",
+    "nightModeEnd",
+    "postcode",
+    "region",
+    "residentialAccountId",
+    "status",
+    "street",
+    "timezone",
+)
+SCENE_FIELDS = ("id", "name")
+
+ACTIVITY_SCHEMA = dict.fromkeys(ACTIVITY_FIELDS)
+DEVICE_SCHEMA = {
+    **dict.fromkeys(DEVICE_FIELDS),
+    "iotButtons": {
+        **dict.fromkeys(BUTTON_FIELDS),
+        "iotButtonActions": {"parameters": {"parameterValue": None}},
+    },
+}
+FIRMWARE_SCHEMA = dict.fromkeys(FIRMWARE_FIELDS)
+RESIDENCE_SCHEMA = dict.fromkeys(RESIDENCE_FIELDS)
+ROOM_SCHEMA = {
+    **dict.fromkeys(ROOM_FIELDS),
+    "residentialScenes": dict.fromkeys(SCENE_FIELDS),
+}
+SCHEDULE_SCHEMA = dict.fromkeys(SCHEDULE_FIELDS)
+
 DEVICE_MODEL = "model"
 DEVICE_TYPE = "type"
 DEVICE_GENERATION = "generation"
@@ -17,6 +124,7 @@ class LoginResult(StrEnum):
     FAILED = "failed"
     SUCCESS = "success"
     TOO_MANY_ATTEMPTS = "too_many_attempts"
+    UNAVAILABLE = "unavailable"
 
 
 class ControlTiming(StrEnum):
@@ -98,6 +206,17 @@ class LoadType(StrEnum):
     UNKNOWN = "unknown"
 
 
+class ModelName(StrEnum):
+    """Model name."""
+
+    ACTIVITY = "ResidentialActivity"
+    IOT_SWITCH = "IotSwitch"
+    RESIDENCE = "Residence"
+    ROOM = "ResidentialRoom"
+    SCENE = "ResidentialScene"
+    SCHEDULE = "ResidentialSchedule"
+
+
 class MotionMode(StrEnum):
     """Motion mode."""
 
@@ -128,6 +247,23 @@ class Power(StrEnum):
     ON = "ON"
 
 
+class ResidenceEndpoint(StrEnum):
+    """Endpoints polled for each residence."""
+
+    ACTIVITIES = "residentialactivities"
+    DEVICES = "iotswitches"
+    ROOMS = "residentialrooms"
+    SCHEDULES = "residentialschedules"
+
+
+class RequestPriority(IntEnum):
+    """Request priority, most urgent first."""
+
+    COMMAND = 0
+    REFRESH = 1
+    POLL = 2
+
+
 class Status(StrEnum):
     """Status."""
 
@@ -0,0 +1,74 @@
+"""Leviton API."""
+
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+import time
+from typing import Any
+
+# Threads per config entry; the rest of the work queues up.
+DEFAULT_WORKERS = 4
+
+
+class LevitonExecutor(ThreadPoolExecutor):
+    """Bounded thread pool for the blocking I/O of one account.
+
+    Keeps a slow Leviton cloud from tying up threads shared with the rest
+    of Home Assistant, and records how deep the queue gets and how long
+    jobs wait in it.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS, **kwargs: Any) -> None:
+        """Initialize."""
+        super().__init__(max_workers=max_workers, **kwargs)
+        self.workers = max_workers
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.queue_depth_max = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self._stats_lock = threading.Lock()
+
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any) -> Future:
+        """Submit a job, tracking its time in the queue."""
+        submitted = time.monotonic()
+
+        def run() -> Any:
+            waited = time.monotonic() - submitted
+            with self._stats_lock:
+                self.queued -= 1
+                self.running += 1
+                self.wait_total += waited
+                self.wait_max = max(self.wait_max, waited)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._stats_lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        with self._stats_lock:
+            self.queued += 1
+            self.queue_depth_max = max(self.queue_depth_max, self.queued)
+        try:
+            return super().submit(run)
+        except RuntimeError:
+            with self._stats_lock:
+                self.queued -= 1
+            raise
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Executor statistics."""
+        with self._stats_lock:
+            started = self.completed + self.running
+            return {
+                "workers": self.workers,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "queue_depth_max": self.queue_depth_max,
+                "wait_mean": round(self.wait_total / started, 4) if started else None,
+                "wait_max": round(self.wait_max, 4),
+            }
@@ -0,0 +1,141 @@
+"""Leviton API."""
+
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import logging
+import math
+import threading
+import time
+from typing import Any
+
+import requests
+
+_LOGGER = logging.getLogger(__name__)
+
+# Hedge a request once it has taken longer than this latency percentile.
+HEDGE_PERCENTILE = 0.95
+# Latencies remembered per key, and needed before hedging starts.
+LATENCY_WINDOW = 200
+MIN_SAMPLES = 20
+# Never hedge sooner than this, however fast the endpoint usually is.
+MIN_HEDGE_DELAY = 0.05
+MAX_WORKERS = 8
+
+
+class LevitonHedger:
+    """Send a duplicate of a request that is slower than usual.
+
+    Latencies are tracked per key (the HTTP method and endpoint). Once a
+    request has been outstanding longer than the tracked percentile, a
+    second copy is sent on another pooled connection and whichever
+    answers first wins; the other response is closed when it arrives.
+    Only use this for idempotent requests.
+    """
+
+    def __init__(self, percentile: float = HEDGE_PERCENTILE) -> None:
+        """Initialize."""
+        self.percentile = percentile
+        self.requests = 0
+        self.fired = 0
+        self.won = 0
+        self._lock = threading.Lock()
+        self._latencies: dict[str, deque[float]] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=MAX_WORKERS, thread_name_prefix="leviton_hedge"
+        )
+
+    def _record(self, key: str, latency: float) -> None:
+        with self._lock:
+            self._latencies.setdefault(key, deque(maxlen=LATENCY_WINDOW)).append(
+                latency
+            )
+
+    def threshold(self, key: str) -> float | None:
+        """Latency after which a request of ``key`` is hedged."""
+        with self._lock:
+            latencies = sorted(self._latencies.get(key, ()))
+        if len(latencies) < MIN_SAMPLES:
+            return None
+        index = min(len(latencies) - 1, math.ceil(self.percentile * len(latencies)) - 1)
+        return max(MIN_HEDGE_DELAY, latencies[index])
+
+    def _submit(self, key: str, function: Callable) -> Future:
+        start = time.monotonic()
+        future = self._executor.submit(function)
+
+        def done(future: Future) -> None:
+            if future.exception() is None:
+                self._record(key, time.monotonic() - start)
+
+        future.add_done_callback(done)
+        return future
+
+    @staticmethod
+    def _discard(future: Future) -> None:
+        """Close the response of the request that lost the race."""
+
+        def close(future: Future) -> None:
+            if future.exception() is None:
+                response: requests.Response = future.result()
+                response.close()
+
+        future.add_done_callback(close)
+
+    def run(
+        self, key: str, function: Callable, copy: Callable | None = None
+    ) -> requests.Response:
+        """Run ``function``, hedging it when it is slower than usual.
+
+        The hedge runs ``copy`` if given, ``function`` otherwise.
+        """
+        with self._lock:
+            self.requests += 1
+        if (threshold := self.threshold(key)) is None:
+            start = time.monotonic()
+            response = function()
+            self._record(key, time.monotonic() - start)
+            return response
+
+        primary = self._submit(key, function)
+        done, _ = wait([primary], timeout=threshold)
+        if done:
+            return primary.result()
+
+        with self._lock:
+            self.fired += 1
+        _LOGGER.debug("Hedging %s request after %.2fs", key, threshold)
+        hedge = self._submit(key, function if copy is None else copy)
+        futures = {primary, hedge}
+        pending = futures
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # Fall back to the other request if this one failed.
+            if winner := next((f for f in done if f.exception() is None), None):
+                if winner is hedge:
+                    with self._lock:
+                        self.won += 1
+                for other in futures - {winner}:
+                    self._discard(other)
+                return winner.result()
+        return primary.result()
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Hedging statistics."""
+        with self._lock:
+            keys = list(self._latencies)
+        return {
+            "requests": self.requests,
+            "fired": self.fired,
+            "won": self.won,
+            "thresholds": {
+                key: round(threshold, 3)
+                for key in keys
+                if (threshold := self.threshold(key)) is not None
+            },
+        }
@@ -0,0 +1,131 @@
+"""Leviton API."""
+
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+import logging
+import threading
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Sustained requests per second and burst size of the token bucket.
+DEFAULT_RATE = 5.0
+DEFAULT_BURST = 10
+
+# On 429 the rate is cut by RATE_DECREASE (down to MIN_RATE); every
+# successful request then wins back RATE_RECOVERY requests per second.
+RATE_DECREASE = 0.5
+RATE_RECOVERY = 0.05
+MIN_RATE = 0.2
+
+# Longest Retry-After honored; anything longer is clamped.
+MAX_RETRY_AFTER = 60.0
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds of a Retry-After header."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except TypeError, ValueError:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+class LevitonRateLimiter:
+    """Token bucket shared by all requests of an account.
+
+    Every request takes a token; tokens refill at ``rate`` per second up
+    to ``burst``. When the server answers 429 the bucket is emptied, no
+    request is let through until its Retry-After has passed and the rate
+    is cut, recovering gradually as requests succeed again.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST) -> None:
+        """Initialize."""
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.throttled = 0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Block until a request may be sent.
+
+        Returns False, without taking a token, if that would take longer
+        than ``timeout`` seconds.
+        """
+        give_up = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                delay = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+                if give_up is not None and now + delay > give_up:
+                    return False
+                self.waited += delay
+            time.sleep(delay)
+
+    def throttle(self, retry_after: float | None = None) -> None:
+        """Slow down after the server answered 429."""
+        with self._lock:
+            now = time.monotonic()
+            self.throttled += 1
+            self.rate = max(MIN_RATE, self.rate * RATE_DECREASE)
+            self._refill(now)
+            self._tokens = 0.0
+            delay = min(
+                MAX_RETRY_AFTER, 1 / self.rate if retry_after is None else retry_after
+            )
+            self._blocked_until = max(self._blocked_until, now + delay)
+        _LOGGER.debug(
+            "Leviton API throttled; pausing %.1fs, rate now %.2f/s", delay, self.rate
+        )
+
+    def record_success(self) -> None:
+        """Recover rate after a request went through."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + RATE_RECOVERY)
+
+    @property
+    def budget(self) -> float:
+        """Requests that may be sent right now without waiting."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return 0.0 if now < self._blocked_until else self._tokens
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Rate limiter statistics."""
+        budget = self.budget
+        return {
+            "budget": round(budget, 2),
+            "burst": self.burst,
+            "rate": round(self.rate, 3),
+            "max_rate": self.max_rate,
+            "blocked_for": round(max(0.0, self._blocked_until - time.monotonic()), 1),
+            "throttled": self.throttled,
+            "waited": round(self.waited, 1),
+        }
@@ -0,0 +1,124 @@
+"""Leviton API."""
+
+import logging
+import random
+import threading
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Retries of idempotent requests and their jittered exponential backoff.
+DEFAULT_RETRIES = 2
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+
+# Consecutive failed requests that open the circuit, and for how long.
+FAILURE_THRESHOLD = 5
+COOL_OFF = 60.0
+
+
+class LevitonRetryPolicy:
+    """Retries with full-jitter exponential backoff."""
+
+    def __init__(
+        self,
+        retries: int = DEFAULT_RETRIES,
+        base: float = BACKOFF_BASE,
+        cap: float = BACKOFF_CAP,
+    ) -> None:
+        """Initialize."""
+        self.retries = retries
+        self.base = base
+        self.cap = cap
+        self.retried = 0
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number ``attempt`` (from 1)."""
+        return random.uniform(0, min(self.cap, self.base * 2 ** (attempt - 1)))
+
+
+class LevitonCircuitBreaker:
+    """Fast-fail requests while the backend keeps failing.
+
+    After ``threshold`` consecutive failures the circuit opens and
+    requests are refused for ``cool_off`` seconds. Then a single trial
+    request is let through: success closes the circuit, failure opens
+    it for another cool-off.
+    """
+
+    def __init__(
+        self, threshold: int = FAILURE_THRESHOLD, cool_off: float = COOL_OFF
+    ) -> None:
+        """Initialize."""
+        self.threshold = threshold
+        self.cool_off = cool_off
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._open_until: float | None = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        """State."""
+        with self._lock:
+            if self._open_until is None:
+                return "closed"
+            if self._trial or time.monotonic() >= self._open_until:
+                return "half_open"
+            return "open"
+
+    def allow(self) -> float | None:
+        """Admit a request, or return the seconds until the circuit may close."""
+        with self._lock:
+            if self._open_until is None:
+                return None
+            remaining = self._open_until - time.monotonic()
+            if remaining <= 0 and not self._trial:
+                self._trial = True
+                return None
+            self.rejected += 1
+            return max(remaining, 0.0)
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy backend."""
+        with self._lock:
+            if self._open_until is not None:
+                _LOGGER.info("Leviton API recovered; closing circuit")
+            self.failures = 0
+            self._open_until = None
+            self._trial = False
+
+    def release(self) -> None:
+        """Give up a trial request that ended without reaching the backend."""
+        with self._lock:
+            self._trial = False
+
+    def record_failure(self) -> None:
+        """Record a request that failed for lack of a healthy backend."""
+        with self._lock:
+            self.failures += 1
+            if self._trial or (
+                self._open_until is None and self.failures >= self.threshold
+            ):
+                if not self._trial:
+                    _LOGGER.warning(
+                        "Leviton API failed %s times in a row; pausing requests for %.0fs",
+                        self.failures,
+                        self.cool_off,
+                    )
+                    self.opened += 1
+                self._open_until = time.monotonic() + self.cool_off
+                self._trial = False
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Circuit breaker statistics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,138 @@
+"""Leviton API."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import threading
+import time
+from typing import Any
+
+from .const import RequestPriority
+
+# Requests of each class allowed in flight at once.
+CONCURRENCY_LIMITS = {
+    RequestPriority.COMMAND: 4,
+    RequestPriority.REFRESH: 2,
+    RequestPriority.POLL: 1,
+}
+
+# Requests of all classes allowed in flight at once.
+MAX_IN_FLIGHT = 6
+
+
+class LevitonRequestScheduler:
+    """Admit REST requests by priority class.
+
+    Every class has its own concurrency limit and all of them share
+    ``MAX_IN_FLIGHT``. While a more urgent request is waiting for the
+    shared budget, less urgent ones are held back, so a command never
+    queues behind the requests of a background poll.
+
+    The priority of a request comes from the calling thread, set with
+    ``priority()``; requests default to ``RequestPriority.COMMAND``.
+    Nested requests made while a thread already holds a slot (a re-login
+    in the middle of a poll, for instance) reuse that slot.
+    """
+
+    def __init__(
+        self,
+        limits: dict[RequestPriority, int] | None = None,
+        max_in_flight: int = MAX_IN_FLIGHT,
+    ) -> None:
+        """Initialize."""
+        self.limits = {**CONCURRENCY_LIMITS, **(limits or {})}
+        self.max_in_flight = max_in_flight
+        self._condition = threading.Condition()
+        self._local = threading.local()
+        self._in_flight = dict.fromkeys(RequestPriority, 0)
+        self._waiting = dict.fromkeys(RequestPriority, 0)
+        self._completed = dict.fromkeys(RequestPriority, 0)
+        self._wait_total = dict.fromkeys(RequestPriority, 0.0)
+        self._wait_max = dict.fromkeys(RequestPriority, 0.0)
+
+    @property
+    def current_priority(self) -> RequestPriority:
+        """Priority of requests made from the calling thread."""
+        priority = getattr(self._local, "priority", None)
+        return RequestPriority.COMMAND if priority is None else priority
+
+    @contextmanager
+    def priority(self, priority: RequestPriority) -> Iterator[None]:
+        """Make requests from the calling thread use ``priority``."""
+        previous = getattr(self._local, "priority", None)
+        self._local.priority = priority
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def _blocked_on_budget(self, priority: RequestPriority) -> bool:
+        return bool(self._waiting[priority]) and (
+            self._in_flight[priority] < self.limits[priority]
+        )
+
+    def _can_run(self, priority: RequestPriority) -> bool:
+        return all(
+            [
+                self._in_flight[priority] < self.limits[priority],
+                sum(self._in_flight.values()) < self.max_in_flight,
+                not any(
+                    self._blocked_on_budget(other)
+                    for other in RequestPriority
+                    if other < priority
+                ),
+            ]
+        )
+
+    @contextmanager
+    def slot(self, timeout: float | None = None) -> Iterator[None]:
+        """Hold a slot for one request of the calling thread's priority.
+
+        Raises TimeoutError if no slot frees up within ``timeout`` seconds.
+        """
+        if getattr(self._local, "holding", False):
+            yield
+            return
+        priority = self.current_priority
+        start = time.monotonic()
+        with self._condition:
+            self._waiting[priority] += 1
+            try:
+                if not self._condition.wait_for(
+                    lambda: self._can_run(priority), timeout
+                ):
+                    raise TimeoutError
+            finally:
+                self._waiting[priority] -= 1
+            self._in_flight[priority] += 1
+            waited = time.monotonic() - start
+            self._wait_total[priority] += waited
+            self._wait_max[priority] = max(self._wait_max[priority], waited)
+        self._local.holding = True
+        try:
+            yield
+        finally:
+            self._local.holding = False
+            with self._condition:
+                self._in_flight[priority] -= 1
+                self._completed[priority] += 1
+                self._condition.notify_all()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Scheduler statistics by priority class."""
+        with self._condition:
+            return {
+                priority.name.lower(): {
+                    "limit": self.limits[priority],
+                    "in_flight": self._in_flight[priority],
+                    "waiting": self._waiting[priority],
+                    "completed": self._completed[priority],
+                    "wait_mean": round(
+                        self._wait_total[priority] / self._completed[priority], 4
+                    )
+                    if self._completed[priority]
+                    else None,
+                    "wait_max": round(self._wait_max[priority], 4),
+                }
+                for priority in RequestPriority
+            }
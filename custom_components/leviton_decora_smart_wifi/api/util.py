@@ -1,5 +1,56 @@
 """Leviton API."""
 
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Decode JSON, preferring orjson when it is installed.
+
+    Both backends raise a ``ValueError`` subclass on malformed input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_UNPARSED = object()
+
+
+def response_json(response: Any) -> Any:
+    """Decode the JSON body of a REST response.
+
+    The body is parsed straight from bytes, once; the result is kept on
+    the response so every later lookup shares it.
+    """
+    data = getattr(response, "_leviton_json", _UNPARSED)
+    if data is _UNPARSED:
+        data = json_loads(response.content)
+        response._leviton_json = data
+    return data
+
+
+def project(data: Any, schema: dict[str, Any]) -> Any:
+    """Reduce a decoded response to the attributes in ``schema``.
+
+    Lists are projected item by item; values other than objects pass
+    through unchanged.
+    """
+    if isinstance(data, list):
+        return [project(item, schema) for item in data]
+    if not isinstance(data, dict):
+        return data
+    return {
+        key: data[key] if nested is None else project(data[key], nested)
+        for key, nested in schema.items()
+        if key in data
+    }
+
 
 def version_tuple(version):
     "Version tuple."
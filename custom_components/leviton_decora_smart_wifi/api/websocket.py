@@ -6,22 +6,29 @@ the official myapp.leviton.com bundle (``authenticateSocketConnection``
 wired to ``onOpen``) and the homebridge-myleviton plugin.
 
 Auth model used here:
-- We do NOT call ``LevitonAPI.login`` from this client. The bearer token
-  already in the config entry is enough to synthesize a token payload.
+- We do NOT call ``LevitonAPI.login`` from this client. The token comes
+  from the provider, which reads the token shared with the REST client.
 - If auth fails, we back off ``AUTH_FAILURE_COOLDOWN`` (default 1 hour)
   before any retry, to avoid hammering Leviton's auth endpoint and
-  locking the account out.
+  locking the account out. ``reconnect`` cuts the wait short once the
+  REST client has logged in again and a fresh token is available.
 """
 
 import asyncio
-from collections.abc import Callable
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Awaitable, Callable
 import contextlib
+from functools import partial
 import json
 import logging
+import time
 from typing import Any
 
 import aiohttp
 
+from .util import json_loads
+
 _LOGGER = logging.getLogger(__name__)
 
 WS_URL = "wss://my.leviton.com/socket/websocket"
@@ -39,6 +46,127 @@ AUTH_FAILURE_COOLDOWN = 3600.0
 
 CHALLENGE_TIMEOUT = 10.0
 
+# Frames received within this many seconds of each other are processed
+# as one batch, so bursts for the same device (dimmer ramps, motion
+# sensors) produce one notification per device instead of one per frame.
+BATCH_WINDOW = 0.05
+
+# Frames waiting to be processed; once full, the receive loop stops
+# reading from the socket until the handler catches up.
+MAX_PENDING_FRAMES = 256
+
+# Notification data keys whose list values accumulate across a batch
+# rather than being replaced by the latest frame.
+COALESCE_APPEND_KEYS = ("btnPress",)
+
+# Frame rates are reported over a sliding window of this many seconds.
+FRAME_RATE_WINDOW = 60.0
+
+# Upper bounds (seconds) of the notification handler latency histogram.
+DISPATCH_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+class LevitonWebSocketStats:
+    """Health and throughput counters for the WebSocket push channel."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.connected_at: float | None = None
+        self.last_notification_at: float | None = None
+        self.reconnect_count = 0
+        self.auth_failure_count = 0
+        self.reconnect_delay = 0.0
+        self.frame_counts: dict[str, int] = {}
+        self._frame_times: dict[str, deque[float]] = {}
+        self.dispatch_latency_counts = [0] * (len(DISPATCH_LATENCY_BUCKETS) + 1)
+        self.dispatch_latency_total = 0.0
+        self.coalesced_count = 0
+
+    def record_frame(self, msg_type: str) -> None:
+        """Record a received frame of the given type."""
+        now = time.monotonic()
+        self.frame_counts[msg_type] = self.frame_counts.get(msg_type, 0) + 1
+        times = self._frame_times.setdefault(msg_type, deque())
+        times.append(now)
+        self._prune(times, now)
+        if msg_type == "notification":
+            self.last_notification_at = now
+
+    def record_dispatch(self, seconds: float) -> None:
+        """Record how long the notification handler took."""
+        self.dispatch_latency_counts[
+            bisect_left(DISPATCH_LATENCY_BUCKETS, seconds)
+        ] += 1
+        self.dispatch_latency_total += seconds
+
+    @staticmethod
+    def _prune(times: deque[float], now: float) -> None:
+        while times and times[0] < now - FRAME_RATE_WINDOW:
+            times.popleft()
+
+    @property
+    def connected(self) -> bool:
+        """Connected."""
+        return self.connected_at is not None
+
+    @property
+    def connection_uptime(self) -> float | None:
+        """Seconds since the current connection authenticated."""
+        if self.connected_at is None:
+            return None
+        return round(time.monotonic() - self.connected_at, 1)
+
+    @property
+    def last_notification_age(self) -> float | None:
+        """Seconds since the last notification frame."""
+        if self.last_notification_at is None:
+            return None
+        return round(time.monotonic() - self.last_notification_at, 1)
+
+    @property
+    def frame_rates(self) -> dict[str, float]:
+        """Frames per second by frame type over the sliding window."""
+        now = time.monotonic()
+        rates = {}
+        for msg_type, times in self._frame_times.items():
+            self._prune(times, now)
+            rates[msg_type] = round(len(times) / FRAME_RATE_WINDOW, 3)
+        return rates
+
+    @property
+    def frame_rate(self) -> float:
+        """Frames per second of all types over the sliding window."""
+        return round(sum(self.frame_rates.values()), 3)
+
+    @property
+    def dispatch_latency_histogram(self) -> dict[str, int]:
+        """Notification handler latency counts keyed by bucket upper bound."""
+        labels = [f"le_{bound * 1000:g}ms" for bound in DISPATCH_LATENCY_BUCKETS]
+        return dict(zip([*labels, "inf"], self.dispatch_latency_counts, strict=True))
+
+    @property
+    def dispatch_latency_mean(self) -> float | None:
+        """Mean notification handler latency in milliseconds."""
+        if not (count := sum(self.dispatch_latency_counts)):
+            return None
+        return round(self.dispatch_latency_total / count * 1000, 3)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a snapshot suitable for diagnostics."""
+        return {
+            "connected": self.connected,
+            "connection_uptime": self.connection_uptime,
+            "reconnect_count": self.reconnect_count,
+            "auth_failure_count": self.auth_failure_count,
+            "reconnect_delay": self.reconnect_delay,
+            "frame_counts": dict(self.frame_counts),
+            "frame_rates": self.frame_rates,
+            "dispatch_latency_histogram": self.dispatch_latency_histogram,
+            "dispatch_latency_mean": self.dispatch_latency_mean,
+            "coalesced_count": self.coalesced_count,
+            "last_notification_age": self.last_notification_age,
+        }
+
 
 class LevitonWebSocket:
     """Persistent WebSocket subscriber for the MyLeviton cloud."""
@@ -48,34 +176,62 @@ class LevitonWebSocket:
         session: aiohttp.ClientSession,
         token_provider: Callable[[], dict[str, Any] | None],
         on_notification: Callable[[dict[str, Any]], None],
+        on_reconnect: Callable[[list[tuple[str, int]]], Awaitable[None]] | None = None,
+        batch_window: float = BATCH_WINDOW,
+        max_pending_frames: int = MAX_PENDING_FRAMES,
     ) -> None:
         """Initialize."""
         self._session = session
         self._token_provider = token_provider
         self._on_notification = on_notification
+        self._on_reconnect = on_reconnect
+        self._batch_window = batch_window
+        self._max_pending_frames = max_pending_frames
         self._subscriptions: list[tuple[str, int]] = []
         self._ws: aiohttp.ClientWebSocketResponse | None = None
         self._task: asyncio.Task | None = None
+        self._resync_task: asyncio.Task | None = None
+        self._subscribe_task: asyncio.Task | None = None
+        self._close_task: asyncio.Task | None = None
+        self._connected_once = False
+        self.stats = LevitonWebSocketStats()
         self._stop = asyncio.Event()
+        self._wake = asyncio.Event()
         self._ready = asyncio.Event()
 
     def set_subscriptions(self, subs: list[tuple[str, int]]) -> None:
-        """Replace the subscription set; takes effect on next connect."""
+        """Replace the subscription set; takes effect on next connect.
+
+        While connected, the ones not subscribed to yet are sent right away.
+        """
+        added = [sub for sub in subs if sub not in self._subscriptions]
         self._subscriptions = list(subs)
-        if self._ready.is_set() and self._ws is not None and not self._ws.closed:
-            self._task = asyncio.create_task(self._send_subscriptions())
+        if (
+            added
+            and self._ready.is_set()
+            and self._ws is not None
+            and not self._ws.closed
+        ):
+            self._subscribe_task = asyncio.create_task(
+                self._send_subscriptions(added), name="leviton_ws_subscribe"
+            )
 
     def start(self) -> None:
         """Start the WebSocket loop as a background task."""
         if self._task and not self._task.done():
             return
         self._stop.clear()
+        self._wake.clear()
         _LOGGER.debug("Leviton WebSocket task starting")
         self._task = asyncio.create_task(self._run(), name="leviton_ws")
 
     async def stop(self) -> None:
         """Stop the WebSocket loop and close the connection."""
         self._stop.set()
+        self._wake.set()
+        for task in (self._resync_task, self._subscribe_task):
+            if task and not task.done():
+                task.cancel()
         if self._ws is not None and not self._ws.closed:
             await self._ws.close()
         if self._task:
@@ -84,6 +240,13 @@ class LevitonWebSocket:
             except TimeoutError, asyncio.CancelledError:
                 self._task.cancel()
 
+    async def reconnect(self) -> None:
+        """Drop the connection and reconnect now, skipping any backoff."""
+        _LOGGER.debug("Leviton WebSocket reconnecting with a fresh token")
+        self._wake.set()
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close()
+
     async def _run(self) -> None:
         delay = INITIAL_RECONNECT_DELAY
         while not self._stop.is_set():
@@ -106,8 +269,10 @@ class LevitonWebSocket:
             finally:
                 self._ready.clear()
                 self._ws = None
+                self.stats.connected_at = None
 
             if outcome == "auth_failed":
+                self.stats.auth_failure_count += 1
                 _LOGGER.warning(
                     "Leviton WebSocket auth failed; cooling down for %.0fs to avoid account lockout",
                     AUTH_FAILURE_COOLDOWN,
@@ -124,8 +289,13 @@ class LevitonWebSocket:
                 delay = min(delay * 2, MAX_RECONNECT_DELAY)
 
     async def _sleep_or_stop(self, seconds: float) -> None:
-        with contextlib.suppress(TimeoutError):
-            await asyncio.wait_for(self._stop.wait(), timeout=seconds)
+        self.stats.reconnect_delay = seconds
+        try:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=seconds)
+        finally:
+            self._wake.clear()
+            self.stats.reconnect_delay = 0.0
 
     async def _connect(self, token: dict[str, Any]) -> str:
         """Open the WS, authenticate, then run the receive loop.
@@ -145,7 +315,12 @@ class LevitonWebSocket:
                 if auth_outcome != "ok":
                     return auth_outcome
                 self._ready.set()
+                self.stats.connected_at = time.monotonic()
                 await self._send_subscriptions()
+                if self._connected_once:
+                    self.stats.reconnect_count += 1
+                    self._start_resync()
+                self._connected_once = True
                 await self._receive_loop(ws)
                 return "ok"
         except aiohttp.ClientError:
@@ -183,7 +358,7 @@ class LevitonWebSocket:
 
             if frame.type is aiohttp.WSMsgType.TEXT:
                 try:
-                    payload = json.loads(frame.data)
+                    payload = json_loads(frame.data)
                 except ValueError:
                     _LOGGER.warning("Non-JSON handshake frame: %r", frame.data)
                     continue
@@ -203,10 +378,12 @@ class LevitonWebSocket:
                 _LOGGER.error("WebSocket error during auth: %s", ws.exception())
                 return "auth_failed"
 
-    async def _send_subscriptions(self) -> None:
+    async def _send_subscriptions(
+        self, subs: list[tuple[str, int]] | None = None
+    ) -> None:
         if self._ws is None or self._ws.closed:
             return
-        for model_name, model_id in self._subscriptions:
+        for model_name, model_id in self._subscriptions if subs is None else subs:
             msg = {
                 "type": "subscribe",
                 "subscription": {"modelName": model_name, "modelId": model_id},
@@ -214,34 +391,143 @@ class LevitonWebSocket:
             _LOGGER.debug("WebSocket subscribe: %s", msg)
             await self._ws.send_json(msg)
 
+    def _start_resync(self) -> None:
+        """Backfill whatever changed while the socket was down.
+
+        Runs alongside the receive loop so pushes arriving during the
+        refresh are not held up behind it.
+        """
+        if self._on_reconnect is None or not self._subscriptions:
+            return
+        if self._resync_task and not self._resync_task.done():
+            self._resync_task.cancel()
+        self._resync_task = asyncio.create_task(
+            self._resync(list(self._subscriptions)), name="leviton_ws_resync"
+        )
+
+    async def _resync(self, subs: list[tuple[str, int]]) -> None:
+        _LOGGER.debug("Leviton WebSocket reconnected; resyncing %d model(s)", len(subs))
+        try:
+            await self._on_reconnect(subs)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            _LOGGER.exception("Reconnect resync handler raised")
+
     async def _receive_loop(self, ws: aiohttp.ClientWebSocketResponse) -> None:
-        async for msg in ws:
-            if self._stop.is_set():
-                break
-            if msg.type is aiohttp.WSMsgType.TEXT:
-                self._dispatch(msg.data)
-            elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSING):
-                _LOGGER.debug("WebSocket closed/closing")
-                break
-            elif msg.type is aiohttp.WSMsgType.ERROR:
-                _LOGGER.warning("WebSocket error: %s", ws.exception())
-                break
-
-    def _dispatch(self, raw: str) -> None:
+        queue: asyncio.Queue[str | None] = asyncio.Queue(
+            maxsize=self._max_pending_frames
+        )
+        consumer = asyncio.create_task(self._consume(queue), name="leviton_ws_dispatch")
+        consumer.add_done_callback(partial(self._consumer_done, ws, queue))
         try:
-            payload = json.loads(raw)
-        except ValueError:
-            _LOGGER.warning("Non-JSON WS frame: %r", raw[:200])
+            async for msg in ws:
+                if self._stop.is_set() or consumer.done():
+                    break
+                if msg.type is aiohttp.WSMsgType.TEXT:
+                    # Blocks while the queue is full, which stops reads from
+                    # the socket instead of buffering without bound.
+                    await queue.put(msg.data)
+                elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSING):
+                    _LOGGER.debug("WebSocket closed/closing")
+                    break
+                elif msg.type is aiohttp.WSMsgType.ERROR:
+                    _LOGGER.warning("WebSocket error: %s", ws.exception())
+                    break
+        finally:
+            if consumer.done() or self._stop.is_set():
+                consumer.cancel()
+            else:
+                # Flush what was already received before reconnecting; a
+                # failure is reported by ``_consumer_done``.
+                await queue.put(None)
+                await asyncio.wait([consumer])
+
+    def _consumer_done(
+        self,
+        ws: aiohttp.ClientWebSocketResponse,
+        queue: asyncio.Queue[str | None],
+        consumer: asyncio.Task,
+    ) -> None:
+        """Report a failed consumer and close the socket so we reconnect."""
+        if consumer.cancelled() or (exc := consumer.exception()) is None:
             return
+        _LOGGER.error("Leviton WebSocket dispatch failed", exc_info=exc)
+        # Nothing drains the queue any more: empty it, so a receive loop
+        # waiting for room wakes up and sees the socket closed.
+        while not queue.empty():
+            queue.get_nowait()
+        if not ws.closed:
+            self._close_task = asyncio.create_task(ws.close(), name="leviton_ws_close")
+
+    async def _consume(self, queue: asyncio.Queue[str | None]) -> None:
+        """Drain the frame queue in batches until a ``None`` sentinel."""
+        while True:
+            raw = await queue.get()
+            if raw is None:
+                return
+            await asyncio.sleep(self._batch_window)
+            frames = [raw]
+            while not queue.empty():
+                if (raw := queue.get_nowait()) is None:
+                    self._dispatch_batch(frames)
+                    return
+                frames.append(raw)
+            self._dispatch_batch(frames)
+
+    def _dispatch_batch(self, frames: list[str]) -> None:
+        """Decode a batch of frames and notify once per model."""
+        pending: dict[tuple[Any, Any], dict[str, Any]] = {}
+        for raw in frames:
+            try:
+                payload = json_loads(raw)
+            except ValueError:
+                _LOGGER.warning("Non-JSON WS frame: %r", raw[:200])
+                continue
 
-        msg_type = payload.get("type")
-        if msg_type == "notification":
-            _LOGGER.debug(
-                "WebSocket notification: %s", json.dumps(payload, sort_keys=True)
-            )
+            msg_type = payload.get("type")
+            self.stats.record_frame(str(msg_type))
+            if msg_type != "notification":
+                _LOGGER.debug("WebSocket frame (type=%s): %s", msg_type, payload)
+                continue
+            # Sorting and re-serializing every frame is only worth it when
+            # somebody is actually reading the debug log.
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "WebSocket notification: %s", json.dumps(payload, sort_keys=True)
+                )
+            notification = payload.get("notification") or {}
+            key = (notification.get("modelName"), notification.get("modelId"))
+            if key[1] is None:
+                key = (key[0], id(notification))
+            if (merged := pending.get(key)) is None:
+                pending[key] = notification
+            else:
+                self._coalesce(merged, notification)
+                self.stats.coalesced_count += 1
+
+        for notification in pending.values():
+            start = time.perf_counter()
             try:
-                self._on_notification(payload.get("notification") or {})
+                self._on_notification(notification)
             except Exception:
                 _LOGGER.exception("Notification handler raised")
-        else:
-            _LOGGER.debug("WebSocket frame (type=%s): %s", msg_type, payload)
+            self.stats.record_dispatch(time.perf_counter() - start)
+
+    @staticmethod
+    def _coalesce(merged: dict[str, Any], notification: dict[str, Any]) -> None:
+        """Fold a later notification for the same model into an earlier one."""
+        data = notification.get("data") or {}
+        merged_data = merged.setdefault("data", {})
+        for key, value in data.items():
+            if (
+                key in COALESCE_APPEND_KEYS
+                and isinstance(value, list)
+                and isinstance(merged_data.get(key), list)
+            ):
+                merged_data[key] = [*merged_data[key], *value]
+            else:
+                merged_data[key] = value
+        merged.update(
+            {key: value for key, value in notification.items() if key != "data"}
+        )
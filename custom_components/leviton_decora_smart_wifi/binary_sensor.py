@@ -10,11 +10,12 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .api.residence import Residence as LevitonResidence
 from .const import CONF_DEVICES, CONF_RESIDENCES, DATA_COORDINATOR, DOMAIN
-from .entity import LevitonEntity
+from .entity import LevitonEntity, async_setup_residences
 
 
 @dataclass(frozen=True)
@@ -49,29 +50,34 @@ async def async_setup_entry(
     conf_residences = entry[CONF_RESIDENCES]
     conf_devices = entry[CONF_DEVICES]
     coordinator = entry[DATA_COORDINATOR]
-    entities: list[LevitonBinarySensorEntity] = []
-
-    for residence in coordinator.data.residences:
-        if residence.id in conf_residences:
-            for device in residence.devices:
-                if device.id in conf_devices:
-                    entities.extend(
-                        LevitonBinarySensorEntity(
-                            coordinator=coordinator,
-                            residence_id=residence.id,
-                            device_id=device.id,
-                            entity_description=description,
-                        )
-                        for description in BINARY_SENSOR_DESCRIPTIONS
-                        if all(
-                            [
-                                hasattr(device, description.key),
-                                description.is_supported(device),
-                            ]
-                        )
+
+    @callback
+    def async_add_residence(residence: LevitonResidence) -> None:
+        """Add the entities of a residence."""
+        if residence.id not in conf_residences:
+            return
+        entities: list[LevitonBinarySensorEntity] = []
+        for device in residence.devices:
+            if device.id in conf_devices:
+                entities.extend(
+                    LevitonBinarySensorEntity(
+                        coordinator=coordinator,
+                        residence_id=residence.id,
+                        device_id=device.id,
+                        entity_description=description,
+                    )
+                    for description in BINARY_SENSOR_DESCRIPTIONS
+                    if all(
+                        [
+                            hasattr(device, description.key),
+                            description.is_supported(device),
+                        ]
                     )
+                )
+
+        async_add_entities(entities)
 
-    async_add_entities(entities)
+    async_setup_residences(hass, config_entry, async_add_residence)
 
 
 class LevitonBinarySensorEntity(BinarySensorEntity, LevitonEntity):
@@ -10,12 +10,13 @@ from homeassistant.components.button import (
     ButtonEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .api.residence import Residence as LevitonResidence
 from .const import CONF_DEVICES, CONF_RESIDENCES, DATA_COORDINATOR, DOMAIN
-from .entity import LevitonEntity
+from .entity import LevitonEntity, async_setup_residences
 
 
 @dataclass(frozen=True)
@@ -53,55 +54,60 @@ async def async_setup_entry(
     conf_residences = entry[CONF_RESIDENCES]
     conf_devices = entry[CONF_DEVICES]
     coordinator = entry[DATA_COORDINATOR]
-    entities: list[LevitonButtonEntity] = []
-
-    for residence in coordinator.data.residences:
-        if residence.id in conf_residences:
-            entities.extend(
-                LevitonButtonEntity(
-                    coordinator=coordinator,
-                    residence_id=residence.id,
-                    activity_id=activity.id,
-                    entity_description=LevitonButtonEntityDescription(
-                        key="activity",
-                        name=None,
-                    ),
-                )
-                for activity in residence.activities
+
+    @callback
+    def async_add_residence(residence: LevitonResidence) -> None:
+        """Add the entities of a residence."""
+        if residence.id not in conf_residences:
+            return
+        entities: list[LevitonButtonEntity] = []
+        entities.extend(
+            LevitonButtonEntity(
+                coordinator=coordinator,
+                residence_id=residence.id,
+                activity_id=activity.id,
+                entity_description=LevitonButtonEntityDescription(
+                    key="activity",
+                    name=None,
+                ),
             )
-            for device in residence.devices:
-                if device.id in conf_devices:
-                    entities.extend(
-                        LevitonButtonEntity(
-                            coordinator=coordinator,
-                            residence_id=residence.id,
-                            device_id=device.id,
-                            button_id=button.id,
-                            entity_description=LevitonButtonEntityDescription(
-                                key="button",
-                                name=None,
-                            ),
-                        )
-                        for button in device.buttons
-                        if device.is_controller
+            for activity in residence.activities
+        )
+        for device in residence.devices:
+            if device.id in conf_devices:
+                entities.extend(
+                    LevitonButtonEntity(
+                        coordinator=coordinator,
+                        residence_id=residence.id,
+                        device_id=device.id,
+                        button_id=button.id,
+                        entity_description=LevitonButtonEntityDescription(
+                            key="button",
+                            name=None,
+                        ),
+                    )
+                    for button in device.buttons
+                    if device.is_controller
+                )
+                entities.extend(
+                    LevitonButtonEntity(
+                        coordinator=coordinator,
+                        residence_id=residence.id,
+                        device_id=device.id,
+                        entity_description=description,
                     )
-                    entities.extend(
-                        LevitonButtonEntity(
-                            coordinator=coordinator,
-                            residence_id=residence.id,
-                            device_id=device.id,
-                            entity_description=description,
-                        )
-                        for description in BUTTON_DESCRIPTIONS
-                        if all(
-                            [
-                                hasattr(device, description.key),
-                                description.is_supported(device),
-                            ]
-                        )
+                    for description in BUTTON_DESCRIPTIONS
+                    if all(
+                        [
+                            hasattr(device, description.key),
+                            description.is_supported(device),
+                        ]
                     )
+                )
+
+        async_add_entities(entities)
 
-    async_add_entities(entities)
+    async_setup_residences(hass, config_entry, async_add_residence)
 
 
 class LevitonButtonEntity(ButtonEntity, LevitonEntity):
@@ -120,5 +126,5 @@ class LevitonButtonEntity(ButtonEntity, LevitonEntity):
 
     async def async_press(self) -> None:
         """Press the button."""
-        await super().async_press()
+        await self.coordinator.async_add_executor_job(self.press)
         await self.coordinator.async_request_refresh()
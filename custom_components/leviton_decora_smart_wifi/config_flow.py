@@ -34,13 +34,17 @@ from .api import LevitonAPI, LevitonData, LevitonException
 from .api.const import LoginResult as LevitonLoginResult
 from .const import (
     CONF_DEVICES,
+    CONF_HEDGE_REQUESTS,
     CONF_LOGIN_RESPONSE,
     CONF_RESIDENCES,
+    CONF_RETRIES,
     CONF_SAVE_RESPONSES,
     CONF_TIMEOUT,
     DATA_API,
+    DEFAULT_HEDGE_REQUESTS,
     DEFAULT_SAVE_RESPONSES,
     DOMAIN,
+    Retries,
     ScanInterval,
     Timeout,
 )
@@ -256,6 +260,8 @@ class LevitonConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self.user_input[CONF_SAVE_RESPONSES] = user_input[CONF_SAVE_RESPONSES]
             self.user_input[CONF_SCAN_INTERVAL] = user_input[CONF_SCAN_INTERVAL]
             self.user_input[CONF_TIMEOUT] = user_input[CONF_TIMEOUT]
+            self.user_input[CONF_RETRIES] = user_input[CONF_RETRIES]
+            self.user_input[CONF_HEDGE_REQUESTS] = user_input[CONF_HEDGE_REQUESTS]
             return self.async_create_entry(
                 title=self.config_title, data=self.user_input
             )
@@ -285,6 +291,16 @@ class LevitonConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             unit_of_measurement=UnitOfTime.SECONDS,
                         )
                     ),
+                    vol.Optional(CONF_RETRIES, default=Retries.DEFAULT): NumberSelector(
+                        NumberSelectorConfig(
+                            min=Retries.MIN,
+                            max=Retries.MAX,
+                            step=Retries.STEP,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_HEDGE_REQUESTS, default=DEFAULT_HEDGE_REQUESTS
+                    ): BooleanSelector(),
                 }
             ),
         )
@@ -422,6 +438,8 @@ class LevitonOptionsFlowHandler(config_entries.OptionsFlow):
             self.user_input[CONF_SAVE_RESPONSES] = user_input[CONF_SAVE_RESPONSES]
             self.user_input[CONF_SCAN_INTERVAL] = user_input[CONF_SCAN_INTERVAL]
             self.user_input[CONF_TIMEOUT] = user_input[CONF_TIMEOUT]
+            self.user_input[CONF_RETRIES] = user_input[CONF_RETRIES]
+            self.user_input[CONF_HEDGE_REQUESTS] = user_input[CONF_HEDGE_REQUESTS]
             return self.async_create_entry(title="", data=self.user_input)
 
         conf_save_responses = self.options.get(
@@ -434,6 +452,13 @@ class LevitonOptionsFlowHandler(config_entries.OptionsFlow):
         conf_timeout = self.options.get(
             CONF_TIMEOUT, self.data.get(CONF_TIMEOUT, Timeout.DEFAULT)
         )
+        conf_retries = self.options.get(
+            CONF_RETRIES, self.data.get(CONF_RETRIES, Retries.DEFAULT)
+        )
+        conf_hedge_requests = self.options.get(
+            CONF_HEDGE_REQUESTS,
+            self.data.get(CONF_HEDGE_REQUESTS, DEFAULT_HEDGE_REQUESTS),
+        )
 
         return self.async_show_form(
             step_id="advanced",
@@ -460,6 +485,16 @@ class LevitonOptionsFlowHandler(config_entries.OptionsFlow):
                             unit_of_measurement=UnitOfTime.SECONDS,
                         )
                     ),
+                    vol.Optional(CONF_RETRIES, default=conf_retries): NumberSelector(
+                        NumberSelectorConfig(
+                            min=Retries.MIN,
+                            max=Retries.MAX,
+                            step=Retries.STEP,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_HEDGE_REQUESTS, default=conf_hedge_requests
+                    ): BooleanSelector(),
                 }
             ),
         )
@@ -1,9 +1,14 @@
 """Constants used by the Leviton Decora Smart Wi-Fi integration."""
 
+from datetime import timedelta
 from enum import IntEnum
 
+from .api.retry import DEFAULT_RETRIES
+
 CONF_DEVICES: str = "devices"
+CONF_HEDGE_REQUESTS: str = "hedge_requests"
 CONF_RESIDENCES: str = "residences"
+CONF_RETRIES: str = "retries"
 CONF_SAVE_RESPONSES: str = "save_responses"
 CONF_TIMEOUT: str = "timeout"
 
@@ -11,6 +16,7 @@ CONFIGURATION_URL: str = "https://my.leviton.com/home"
 
 DATA_API: str = "api"
 DATA_COORDINATOR: str = "coordinator"
+DATA_OPTIONS: str = "options"
 DATA_WEBSOCKET: str = "websocket"
 
 CONF_LOGIN_RESPONSE: str = "login_response"
@@ -19,16 +25,34 @@ DOMAIN: str = "leviton_decora_smart_wifi"
 
 EVENT_NOTIFICATION: str = f"{DOMAIN}_event"
 UPDATE_NOTIFICATION: str = f"{DOMAIN}_update"
+RESIDENCE_NOTIFICATION: str = f"{DOMAIN}_residence"
 
 UNDO_UPDATE_LISTENER: str = "undo_update_listener"
 
+TOKEN_REFRESH_RETRY: timedelta = timedelta(hours=1)
+
+PREWARM_LEAD: timedelta = timedelta(seconds=5)
+
+STORAGE_VERSION: int = 1
+STORAGE_SAVE_DELAY: timedelta = timedelta(minutes=1)
+
 DEFAULT_SAVE_LOCATION: str = f"/config/custom_components/{DOMAIN}/api/responses"
 DEFAULT_SAVE_RESPONSES: bool = False
+DEFAULT_HEDGE_REQUESTS: bool = False
 
 DEVICE_INFO_MANUFACTURER: str = "Leviton Manufacturing Co., Inc."
 DEVICE_INFO_MODEL_RESIDENCE: str = "Residence"
 
 
+class Retries(IntEnum):
+    """Retries."""
+
+    DEFAULT = DEFAULT_RETRIES
+    MAX = 5
+    MIN = 0
+    STEP = 1
+
+
 class ScanInterval(IntEnum):
     """Scan interval."""
 
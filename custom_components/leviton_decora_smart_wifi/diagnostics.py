@@ -0,0 +1,43 @@
+"""Diagnostics support for the Leviton Decora Smart Wi-Fi integration."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_CODE, CONF_EMAIL, CONF_PASSWORD, CONF_TOKEN
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_LOGIN_RESPONSE,
+    DATA_API,
+    DATA_COORDINATOR,
+    DATA_WEBSOCKET,
+    DOMAIN,
+)
+
+TO_REDACT = {CONF_CODE, CONF_EMAIL, CONF_LOGIN_RESPONSE, CONF_PASSWORD, CONF_TOKEN}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry = hass.data[DOMAIN][config_entry.entry_id]
+    api = entry[DATA_API]
+    websocket = entry.get(DATA_WEBSOCKET)
+    return {
+        "entry": {
+            "data": async_redact_data(config_entry.data, TO_REDACT),
+            "options": async_redact_data(config_entry.options, TO_REDACT),
+        },
+        "executor": entry[DATA_COORDINATOR].executor.stats,
+        "restored": entry[DATA_COORDINATOR].restored,
+        "rest_pool": api.adapter.stats,
+        "rest_transfers": api.adapter.transfer_stats,
+        "scheduler": api.scheduler.stats,
+        "rate_limit": api.rate_limiter.stats,
+        "circuit_breaker": api.circuit_breaker.stats,
+        "retries": api.retry_policy.retried,
+        "hedging": api.hedger.stats if api.hedger else None,
+        "websocket": websocket.stats.as_dict() if websocket else None,
+    }
@@ -1,8 +1,10 @@
 """Base class for Leviton Decora Smart Wi-Fi entities."""
 
+from collections.abc import Callable
 from typing import Any
 
-from homeassistant.core import callback
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityDescription
@@ -11,6 +13,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from . import LevitonDataUpdateCoordinator
 from .api.activity import Activity as LevitonActivity
 from .api.button import Button as LevitonButton
+from .api.const import ModelName
 from .api.device import Device as LevitonDevice
 from .api.firmware import Firmware as LevitonFirmware
 from .api.residence import Residence as LevitonResidence
@@ -19,13 +22,39 @@ from .api.scene import Scene as LevitonScene
 from .api.schedule import Schedule as LevitonSchedule
 from .const import (
     CONFIGURATION_URL,
+    DATA_COORDINATOR,
     DEVICE_INFO_MANUFACTURER,
     DEVICE_INFO_MODEL_RESIDENCE,
     DOMAIN,
+    RESIDENCE_NOTIFICATION,
     UPDATE_NOTIFICATION,
 )
 
 
+@callback
+def async_setup_residences(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_residence: Callable[[LevitonResidence], None],
+) -> None:
+    """Add a platform's entities residence by residence.
+
+    Residences already loaded are added now, the others as the first
+    update announces them, so each is usable as soon as it is fetched.
+    """
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][DATA_COORDINATOR]
+    if coordinator.data is not None:
+        for residence in coordinator.data.residences:
+            async_add_residence(residence)
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            f"{RESIDENCE_NOTIFICATION}_{config_entry.entry_id}",
+            async_add_residence,
+        )
+    )
+
+
 class LevitonEntity(CoordinatorEntity[LevitonDataUpdateCoordinator]):
     """Representation of a Leviton entity."""
 
@@ -231,13 +260,20 @@ class LevitonEntity(CoordinatorEntity[LevitonDataUpdateCoordinator]):
         """
         await super().async_added_to_hass()
         if self.device and self.device.id:
-            self.async_on_remove(
-                async_dispatcher_connect(
-                    self.hass,
-                    f"{UPDATE_NOTIFICATION}_{self.device.id}",
-                    self.handle_notification,
-                )
-            )
+            signal = f"{UPDATE_NOTIFICATION}_{self.device.id}"
+        elif self.schedule and self.schedule.id:
+            signal = f"{UPDATE_NOTIFICATION}_{ModelName.SCHEDULE}_{self.schedule.id}"
+        elif self.activity and self.activity.id:
+            signal = f"{UPDATE_NOTIFICATION}_{ModelName.ACTIVITY}_{self.activity.id}"
+        elif self.scene and self.scene.id:
+            signal = f"{UPDATE_NOTIFICATION}_{ModelName.SCENE}_{self.scene.id}"
+        elif self.residence and self.residence.id:
+            signal = f"{UPDATE_NOTIFICATION}_{ModelName.RESIDENCE}_{self.residence.id}"
+        else:
+            return
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, signal, self.handle_notification)
+        )
 
     @callback
     def handle_notification(self, notification: dict[str, Any]) -> None:
@@ -12,8 +12,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .api.residence import Residence as LevitonResidence
 from .const import CONF_DEVICES, CONF_RESIDENCES, DATA_COORDINATOR, DOMAIN
-from .entity import LevitonEntity
+from .entity import LevitonEntity, async_setup_residences
 
 EVENT_TYPE_PRESS = "press"
 
@@ -34,33 +35,34 @@ async def async_setup_entry(
     conf_residences = entry_data[CONF_RESIDENCES]
     conf_devices = entry_data[CONF_DEVICES]
 
-    entities: list[LevitonButtonEvent] = []
-    if coordinator.data is None:
-        async_add_entities(entities)
-        return
-
-    for residence in coordinator.data.residences:
-        if residence.id in conf_residences:
-            for device in residence.devices:
-                if device.id in conf_devices:
-                    entities.extend(
-                        LevitonButtonEvent(
-                            coordinator=coordinator,
-                            residence_id=residence.id,
-                            device_id=device.id,
-                            button_id=button.id,
-                            entity_description=LevitonEventEntityDescription(
-                                key="event",
-                                name=None,
-                                device_class=EventDeviceClass.BUTTON,
-                                event_types=[EVENT_TYPE_PRESS],
-                            ),
-                        )
-                        for button in device.buttons
-                        if device.is_controller
+    @callback
+    def async_add_residence(residence: LevitonResidence) -> None:
+        """Add the entities of a residence."""
+        if residence.id not in conf_residences:
+            return
+        entities: list[LevitonButtonEvent] = []
+        for device in residence.devices:
+            if device.id in conf_devices:
+                entities.extend(
+                    LevitonButtonEvent(
+                        coordinator=coordinator,
+                        residence_id=residence.id,
+                        device_id=device.id,
+                        button_id=button.id,
+                        entity_description=LevitonEventEntityDescription(
+                            key="event",
+                            name=None,
+                            device_class=EventDeviceClass.BUTTON,
+                            event_types=[EVENT_TYPE_PRESS],
+                        ),
                     )
+                    for button in device.buttons
+                    if device.is_controller
+                )
+
+        async_add_entities(entities)
 
-    async_add_entities(entities)
+    async_setup_residences(hass, config_entry, async_add_residence)
 
 
 class LevitonButtonEvent(LevitonEntity, EventEntity):
@@ -1,6 +1,7 @@
 """Support for Leviton Decora Smart Wi-Fi fan entities."""
 
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
 from homeassistant.components.fan import (
@@ -9,11 +10,12 @@ from homeassistant.components.fan import (
     FanEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .api.residence import Residence as LevitonResidence
 from .const import CONF_DEVICES, CONF_RESIDENCES, DATA_COORDINATOR, DOMAIN
-from .entity import LevitonEntity
+from .entity import LevitonEntity, async_setup_residences
 
 
 @dataclass(frozen=True)
@@ -31,30 +33,35 @@ async def async_setup_entry(
     conf_residences = entry[CONF_RESIDENCES]
     conf_devices = entry[CONF_DEVICES]
     coordinator = entry[DATA_COORDINATOR]
-    entities: list[LevitonFanEntity] = []
-
-    for residence in coordinator.data.residences:
-        if residence.id in conf_residences:
-            entities.extend(
-                LevitonFanEntity(
-                    coordinator=coordinator,
-                    residence_id=residence.id,
-                    device_id=device.id,
-                    entity_description=LevitonFanEntityDescription(
-                        key="fan",
-                        name=None,
-                    ),
-                )
-                for device in residence.devices
-                if all(
-                    [
-                        device.id in conf_devices,
-                        device.is_fan,
-                    ]
-                )
+
+    @callback
+    def async_add_residence(residence: LevitonResidence) -> None:
+        """Add the entities of a residence."""
+        if residence.id not in conf_residences:
+            return
+        entities: list[LevitonFanEntity] = []
+        entities.extend(
+            LevitonFanEntity(
+                coordinator=coordinator,
+                residence_id=residence.id,
+                device_id=device.id,
+                entity_description=LevitonFanEntityDescription(
+                    key="fan",
+                    name=None,
+                ),
+            )
+            for device in residence.devices
+            if all(
+                [
+                    device.id in conf_devices,
+                    device.is_fan,
+                ]
             )
+        )
+
+        async_add_entities(entities)
 
-    async_add_entities(entities)
+    async_setup_residences(hass, config_entry, async_add_residence)
 
 
 class LevitonFanEntity(FanEntity, LevitonEntity):
@@ -110,7 +117,9 @@ class LevitonFanEntity(FanEntity, LevitonEntity):
         **kwargs: Any,
     ) -> None:
         """Turn the entity on."""
-        await super().async_turn_on(percentage, preset_mode, **kwargs)
+        await self.coordinator.async_add_executor_job(
+            partial(self.turn_on, percentage, preset_mode, **kwargs)
+        )
         await self.coordinator.async_request_refresh()
 
     def turn_off(self, **kwargs: Any) -> None:
@@ -120,7 +129,7 @@ class LevitonFanEntity(FanEntity, LevitonEntity):
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
-        await super().async_turn_off(**kwargs)
+        await self.coordinator.async_add_executor_job(partial(self.turn_off, **kwargs))
         await self.coordinator.async_request_refresh()
 
     def set_percentage(self, percentage: int) -> None:
@@ -130,5 +139,5 @@ class LevitonFanEntity(FanEntity, LevitonEntity):
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage of the fan."""
-        await super().async_set_percentage(percentage)
+        await self.coordinator.async_add_executor_job(self.set_percentage, percentage)
         await self.coordinator.async_request_refresh()
@@ -7,14 +7,15 @@ from typing import Any
 
 from homeassistant.components.image import ImageEntity, ImageEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
 from . import LevitonDataUpdateCoordinator
+from .api.residence import Residence as LevitonResidence
 from .const import CONF_DEVICES, CONF_RESIDENCES, DATA_COORDINATOR, DOMAIN
-from .entity import LevitonEntity
+from .entity import LevitonEntity, async_setup_residences
 
 
 @dataclass(frozen=True)
@@ -45,30 +46,35 @@ async def async_setup_entry(
     conf_residences = entry[CONF_RESIDENCES]
     conf_devices = entry[CONF_DEVICES]
     coordinator = entry[DATA_COORDINATOR]
-    entities: list[LevitonImageEntity] = []
-
-    for residence in coordinator.data.residences:
-        if residence.id in conf_residences:
-            for device in residence.devices:
-                if device.id in conf_devices:
-                    entities.extend(
-                        LevitonImageEntity(
-                            coordinator=coordinator,
-                            residence_id=residence.id,
-                            device_id=device.id,
-                            entity_description=description,
-                            hass=hass,
-                        )
-                        for description in IMAGE_DESCRIPTIONS
-                        if all(
-                            [
-                                hasattr(device, description.key),
-                                description.is_supported(device),
-                            ]
-                        )
+
+    @callback
+    def async_add_residence(residence: LevitonResidence) -> None:
+        """Add the entities of a residence."""
+        if residence.id not in conf_residences:
+            return
+        entities: list[LevitonImageEntity] = []
+        for device in residence.devices:
+            if device.id in conf_devices:
+                entities.extend(
+                    LevitonImageEntity(
+                        coordinator=coordinator,
+                        residence_id=residence.id,
+                        device_id=device.id,
+                        entity_description=description,
+                        hass=hass,
+                    )
+                    for description in IMAGE_DESCRIPTIONS
+                    if all(
+                        [
+                            hasattr(device, description.key),
+                            description.is_supported(device),
+                        ]
                     )
+                )
+
+        async_add_entities(entities)
 
-    async_add_entities(entities)
+    async_setup_residences(hass, config_entry, async_add_residence)
 
 
 class LevitonImageEntity(LevitonEntity, ImageEntity):
@@ -1,6 +1,7 @@
 """Support for Leviton Decora Smart Wi-Fi light entities."""
 
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
 from homeassistant.components.light import (
@@ -10,11 +11,12 @@ from homeassistant.components.light import (
     LightEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .api.residence import Residence as LevitonResidence
 from .const import CONF_DEVICES, CONF_RESIDENCES, DATA_COORDINATOR, DOMAIN
-from .entity import LevitonEntity
+from .entity import LevitonEntity, async_setup_residences
 
 
 @dataclass(frozen=True)
@@ -32,30 +34,35 @@ async def async_setup_entry(
     conf_residences = entry[CONF_RESIDENCES]
     conf_devices = entry[CONF_DEVICES]
     coordinator = entry[DATA_COORDINATOR]
-    entities: list[LevitonLightEntity] = []
-
-    for residence in coordinator.data.residences:
-        if residence.id in conf_residences:
-            entities.extend(
-                LevitonLightEntity(
-                    coordinator=coordinator,
-                    residence_id=residence.id,
-                    device_id=device.id,
-                    entity_description=LevitonLightEntityDescription(
-                        key="light",
-                        name=None,
-                    ),
-                )
-                for device in residence.devices
-                if all(
-                    [
-                        device.id in conf_devices,
-                        device.is_light,
-                    ]
-                )
+
+    @callback
+    def async_add_residence(residence: LevitonResidence) -> None:
+        """Add the entities of a residence."""
+        if residence.id not in conf_residences:
+            return
+        entities: list[LevitonLightEntity] = []
+        entities.extend(
+            LevitonLightEntity(
+                coordinator=coordinator,
+                residence_id=residence.id,
+                device_id=device.id,
+                entity_description=LevitonLightEntityDescription(
+                    key="light",
+                    name=None,
+                ),
+            )
+            for device in residence.devices
+            if all(
+                [
+                    device.id in conf_devices,
+                    device.is_light,
+                ]
             )
+        )
+
+        async_add_entities(entities)
 
-    async_add_entities(entities)
+    async_setup_residences(hass, config_entry, async_add_residence)
 
 
 class LevitonLightEntity(LightEntity, LevitonEntity):
@@ -99,7 +106,7 @@ class LevitonLightEntity(LightEntity, LevitonEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
-        await super().async_turn_on(**kwargs)
+        await self.coordinator.async_add_executor_job(partial(self.turn_on, **kwargs))
         await self.coordinator.async_request_refresh()
 
     def turn_off(self, **kwargs: Any) -> None:
@@ -109,5 +116,5 @@ class LevitonLightEntity(LightEntity, LevitonEntity):
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
-        await super().async_turn_off(**kwargs)
+        await self.coordinator.async_add_executor_job(partial(self.turn_off, **kwargs))
         await self.coordinator.async_request_refresh()
@@ -11,13 +11,14 @@ from homeassistant.components.number import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .api.const import Level
+from .api.residence import Residence as LevitonResidence
 from .const import CONF_DEVICES, CONF_RESIDENCES, DATA_COORDINATOR, DOMAIN
-from .entity import LevitonEntity
+from .entity import LevitonEntity, async_setup_residences
 
 
 @dataclass(frozen=True)
@@ -85,29 +86,34 @@ async def async_setup_entry(
     conf_residences = entry[CONF_RESIDENCES]
     conf_devices = entry[CONF_DEVICES]
     coordinator = entry[DATA_COORDINATOR]
-    entities: list[LevitonNumberEntity] = []
-
-    for residence in coordinator.data.residences:
-        if residence.id in conf_residences:
-            for device in residence.devices:
-                if device.id in conf_devices:
-                    entities.extend(
-                        LevitonNumberEntity(
-                            coordinator=coordinator,
-                            residence_id=residence.id,
-                            device_id=device.id,
-                            entity_description=description,
-                        )
-                        for description in NUMBER_DESCRIPTIONS
-                        if all(
-                            [
-                                hasattr(device, description.key),
-                                description.is_supported(device),
-                            ]
-                        )
+
+    @callback
+    def async_add_residence(residence: LevitonResidence) -> None:
+        """Add the entities of a residence."""
+        if residence.id not in conf_residences:
+            return
+        entities: list[LevitonNumberEntity] = []
+        for device in residence.devices:
+            if device.id in conf_devices:
+                entities.extend(
+                    LevitonNumberEntity(
+                        coordinator=coordinator,
+                        residence_id=residence.id,
+                        device_id=device.id,
+                        entity_description=description,
+                    )
+                    for description in NUMBER_DESCRIPTIONS
+                    if all(
+                        [
+                            hasattr(device, description.key),
+                            description.is_supported(device),
+                        ]
                     )
+                )
+
+        async_add_entities(entities)
 
-    async_add_entities(entities)
+    async_setup_residences(hass, config_entry, async_add_residence)
 
 
 class LevitonNumberEntity(NumberEntity, LevitonEntity):
@@ -140,5 +146,5 @@ class LevitonNumberEntity(NumberEntity, LevitonEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
-        await super().async_set_native_value(value)
+        await self.coordinator.async_add_executor_job(self.set_native_value, value)
         await self.coordinator.async_request_refresh()
@@ -5,12 +5,13 @@ from typing import Any
 
 from homeassistant.components.scene import Scene
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory, EntityDescription
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .api.residence import Residence as LevitonResidence
 from .const import CONF_RESIDENCES, DATA_COORDINATOR, DOMAIN
-from .entity import LevitonEntity
+from .entity import LevitonEntity, async_setup_residences
 
 
 @dataclass(frozen=True)
@@ -27,27 +28,32 @@ async def async_setup_entry(
     entry = hass.data[DOMAIN][config_entry.entry_id]
     conf_residences = entry[CONF_RESIDENCES]
     coordinator = entry[DATA_COORDINATOR]
-    entities: list[LevitonSceneEntity] = []
 
-    for residence in coordinator.data.residences:
-        if residence.id in conf_residences:
-            for room in residence.rooms:
-                entities.extend(
-                    LevitonSceneEntity(
-                        coordinator=coordinator,
-                        residence_id=residence.id,
-                        room_id=room.id,
-                        scene_id=scene.id,
-                        entity_description=LevitonSceneEntityDescription(
-                            key="scene",
-                            entity_category=EntityCategory.CONFIG,
-                            name=None,
-                        ),
-                    )
-                    for scene in room.scenes
+    @callback
+    def async_add_residence(residence: LevitonResidence) -> None:
+        """Add the entities of a residence."""
+        if residence.id not in conf_residences:
+            return
+        entities: list[LevitonSceneEntity] = []
+        for room in residence.rooms:
+            entities.extend(
+                LevitonSceneEntity(
+                    coordinator=coordinator,
+                    residence_id=residence.id,
+                    room_id=room.id,
+                    scene_id=scene.id,
+                    entity_description=LevitonSceneEntityDescription(
+                        key="scene",
+                        entity_category=EntityCategory.CONFIG,
+                        name=None,
+                    ),
                 )
+                for scene in room.scenes
+            )
 
-    async_add_entities(entities)
+        async_add_entities(entities)
+
+    async_setup_residences(hass, config_entry, async_add_residence)
 
 
 class LevitonSceneEntity(Scene, LevitonEntity):
@@ -62,5 +68,5 @@ class LevitonSceneEntity(Scene, LevitonEntity):
 
     async def async_activate(self, **kwargs: Any) -> None:
         """Activate scene. Try to get entities into requested state."""
-        await super().async_activate()
+        await self.coordinator.async_add_executor_job(self.activate)
         await self.coordinator.async_request_refresh()
@@ -6,12 +6,13 @@ from typing import Any
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .api.residence import Residence as LevitonResidence
 from .const import CONF_DEVICES, CONF_RESIDENCES, DATA_COORDINATOR, DOMAIN
-from .entity import LevitonEntity
+from .entity import LevitonEntity, async_setup_residences
 
 
 @dataclass(frozen=True)
@@ -138,39 +139,44 @@ async def async_setup_entry(
     conf_residences = entry[CONF_RESIDENCES]
     conf_devices = entry[CONF_DEVICES]
     coordinator = entry[DATA_COORDINATOR]
-    entities: list[LevitonSelectEntity] = []
-
-    for residence in coordinator.data.residences:
-        if residence.id in conf_residences:
-            entities.extend(
-                LevitonSelectEntity(
-                    coordinator=coordinator,
-                    residence_id=residence.id,
-                    entity_description=description,
-                )
-                for description in SELECT_DESCRIPTIONS
-                if hasattr(residence, description.key)
-            )
 
-            for device in residence.devices:
-                if device.id in conf_devices:
-                    entities.extend(
-                        LevitonSelectEntity(
-                            coordinator=coordinator,
-                            residence_id=residence.id,
-                            device_id=device.id,
-                            entity_description=description,
-                        )
-                        for description in SELECT_DESCRIPTIONS
-                        if all(
-                            [
-                                hasattr(device, description.key),
-                                description.is_supported(device),
-                            ]
-                        )
+    @callback
+    def async_add_residence(residence: LevitonResidence) -> None:
+        """Add the entities of a residence."""
+        if residence.id not in conf_residences:
+            return
+        entities: list[LevitonSelectEntity] = []
+        entities.extend(
+            LevitonSelectEntity(
+                coordinator=coordinator,
+                residence_id=residence.id,
+                entity_description=description,
+            )
+            for description in SELECT_DESCRIPTIONS
+            if hasattr(residence, description.key)
+        )
+
+        for device in residence.devices:
+            if device.id in conf_devices:
+                entities.extend(
+                    LevitonSelectEntity(
+                        coordinator=coordinator,
+                        residence_id=residence.id,
+                        device_id=device.id,
+                        entity_description=description,
                     )
+                    for description in SELECT_DESCRIPTIONS
+                    if all(
+                        [
+                            hasattr(device, description.key),
+                            description.is_supported(device),
+                        ]
+                    )
+                )
+
+        async_add_entities(entities)
 
-    async_add_entities(entities)
+    async_setup_residences(hass, config_entry, async_add_residence)
 
 
 class LevitonSelectEntity(SelectEntity, LevitonEntity):
@@ -196,5 +202,5 @@ class LevitonSelectEntity(SelectEntity, LevitonEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        await super().async_select_option(option)
+        await self.coordinator.async_add_executor_job(self.select_option, option)
         await self.coordinator.async_request_refresh()
@@ -12,15 +12,23 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT
-from homeassistant.core import HomeAssistant
+from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
 from .api.const import GFCIStatus
-from .const import CONF_DEVICES, CONF_RESIDENCES, DATA_COORDINATOR, DOMAIN
-from .entity import LevitonEntity
+from .api.residence import Residence as LevitonResidence
+from .api.websocket import LevitonWebSocket, LevitonWebSocketStats
+from .const import (
+    CONF_DEVICES,
+    CONF_RESIDENCES,
+    DATA_COORDINATOR,
+    DATA_WEBSOCKET,
+    DOMAIN,
+)
+from .entity import LevitonEntity, async_setup_residences
 
 
 @dataclass(frozen=True)
@@ -69,6 +77,80 @@ SENSOR_DESCRIPTIONS: list[LevitonSensorEntityDescription] = [
 ]
 
 
+@dataclass(frozen=True)
+class LevitonWebSocketSensorEntityDescription(LevitonSensorEntityDescription):
+    """Class to describe a Leviton Decora Smart Wi-Fi WebSocket sensor entity."""
+
+    value_fn: Callable[[LevitonWebSocketStats], StateType] = lambda stats: None
+    attributes_fn: Callable[[LevitonWebSocketStats], dict[str, Any] | None] = (
+        lambda stats: None
+    )
+
+
+WEBSOCKET_SENSOR_DESCRIPTIONS: list[LevitonWebSocketSensorEntityDescription] = [
+    LevitonWebSocketSensorEntityDescription(
+        key="websocket_uptime",
+        name="WebSocket Uptime",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        icon="mdi:timer-outline",
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats: stats.connection_uptime,
+    ),
+    LevitonWebSocketSensorEntityDescription(
+        key="websocket_reconnects",
+        name="WebSocket Reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:connection",
+        value_fn=lambda stats: stats.reconnect_count,
+    ),
+    LevitonWebSocketSensorEntityDescription(
+        key="websocket_auth_failures",
+        name="WebSocket Auth Failures",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:account-lock",
+        value_fn=lambda stats: stats.auth_failure_count,
+    ),
+    LevitonWebSocketSensorEntityDescription(
+        key="websocket_backoff",
+        name="WebSocket Backoff",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        icon="mdi:timer-sand",
+        value_fn=lambda stats: stats.reconnect_delay,
+    ),
+    LevitonWebSocketSensorEntityDescription(
+        key="websocket_frame_rate",
+        name="WebSocket Frame Rate",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="frames/s",
+        icon="mdi:swap-vertical",
+        value_fn=lambda stats: stats.frame_rate,
+        attributes_fn=lambda stats: stats.frame_rates,
+    ),
+    LevitonWebSocketSensorEntityDescription(
+        key="websocket_dispatch_latency",
+        name="WebSocket Dispatch Latency",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        icon="mdi:timer-cog-outline",
+        value_fn=lambda stats: stats.dispatch_latency_mean,
+        attributes_fn=lambda stats: stats.dispatch_latency_histogram,
+    ),
+    LevitonWebSocketSensorEntityDescription(
+        key="websocket_last_notification",
+        name="WebSocket Last Notification",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        icon="mdi:bell-ring-outline",
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats: stats.last_notification_age,
+    ),
+]
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -79,39 +161,60 @@ async def async_setup_entry(
     conf_residences = entry[CONF_RESIDENCES]
     conf_devices = entry[CONF_DEVICES]
     coordinator = entry[DATA_COORDINATOR]
-    entities: list[LevitonSensorEntity] = []
+    websocket = entry.get(DATA_WEBSOCKET)
+    websocket_residence: list[int] = []
 
-    for residence in coordinator.data.residences:
-        if residence.id in conf_residences:
+    @callback
+    def async_add_residence(residence: LevitonResidence) -> None:
+        """Add the entities of a residence."""
+        if residence.id not in conf_residences:
+            return
+        entities: list[LevitonSensorEntity] = []
+        entities.extend(
+            LevitonSensorEntity(
+                coordinator=coordinator,
+                residence_id=residence.id,
+                entity_description=description,
+            )
+            for description in SENSOR_DESCRIPTIONS
+            if hasattr(residence, description.key)
+        )
+
+        for device in residence.devices:
+            if device.id in conf_devices:
+                entities.extend(
+                    LevitonSensorEntity(
+                        coordinator=coordinator,
+                        residence_id=residence.id,
+                        device_id=device.id,
+                        entity_description=description,
+                    )
+                    for description in SENSOR_DESCRIPTIONS
+                    if all(
+                        [
+                            hasattr(device, description.key),
+                            description.is_supported(device),
+                        ]
+                    )
+                )
+
+        # One WebSocket serves the whole config entry, so its health sensors
+        # live on the first configured residence rather than being repeated.
+        if websocket is not None and not websocket_residence:
+            websocket_residence.append(residence.id)
             entities.extend(
-                LevitonSensorEntity(
+                LevitonWebSocketSensorEntity(
                     coordinator=coordinator,
                     residence_id=residence.id,
                     entity_description=description,
+                    websocket=websocket,
                 )
-                for description in SENSOR_DESCRIPTIONS
-                if hasattr(residence, description.key)
+                for description in WEBSOCKET_SENSOR_DESCRIPTIONS
             )
 
-            for device in residence.devices:
-                if device.id in conf_devices:
-                    entities.extend(
-                        LevitonSensorEntity(
-                            coordinator=coordinator,
-                            residence_id=residence.id,
-                            device_id=device.id,
-                            entity_description=description,
-                        )
-                        for description in SENSOR_DESCRIPTIONS
-                        if all(
-                            [
-                                hasattr(device, description.key),
-                                description.is_supported(device),
-                            ]
-                        )
-                    )
+        async_add_entities(entities)
 
-    async_add_entities(entities)
+    async_setup_residences(hass, config_entry, async_add_residence)
 
 
 class LevitonSensorEntity(SensorEntity, LevitonEntity):
@@ -123,3 +226,32 @@ class LevitonSensorEntity(SensorEntity, LevitonEntity):
     def native_value(self) -> StateType | date | datetime:
         """Return the value reported by the sensor."""
         return getattr(self.target, self.entity_description.key)
+
+
+class LevitonWebSocketSensorEntity(LevitonSensorEntity):
+    """Representation of a Leviton Decora Smart Wi-Fi WebSocket sensor entity."""
+
+    entity_description: LevitonWebSocketSensorEntityDescription
+
+    def __init__(self, websocket: LevitonWebSocket, **kwargs: Any) -> None:
+        """Initialize the entity."""
+        super().__init__(**kwargs)
+        self.websocket = websocket
+
+    @property
+    def should_poll(self) -> bool:
+        """Poll, since the counters move independently of the coordinator."""
+        return True
+
+    async def async_update(self) -> None:
+        """Read the counters; there is nothing to fetch."""
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value reported by the sensor."""
+        return self.entity_description.value_fn(self.websocket.stats)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self.entity_description.attributes_fn(self.websocket.stats)
@@ -2,6 +2,7 @@
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
 from homeassistant.components.switch import (
@@ -10,12 +11,13 @@ from homeassistant.components.switch import (
     SwitchEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .api.residence import Residence as LevitonResidence
 from .const import CONF_DEVICES, CONF_RESIDENCES, DATA_COORDINATOR, DOMAIN
-from .entity import LevitonEntity
+from .entity import LevitonEntity, async_setup_residences
 
 
 @dataclass(frozen=True)
@@ -87,69 +89,74 @@ async def async_setup_entry(
     conf_residences = entry[CONF_RESIDENCES]
     conf_devices = entry[CONF_DEVICES]
     coordinator = entry[DATA_COORDINATOR]
-    entities: list[LevitonSwitchEntity] = []
-
-    for residence in coordinator.data.residences:
-        if residence.id in conf_residences:
-            entities.extend(
-                LevitonSwitchEntity(
-                    coordinator=coordinator,
-                    residence_id=residence.id,
-                    entity_description=description,
-                )
-                for description in SWITCH_DESCRIPTIONS
-                if hasattr(residence, description.key)
+
+    @callback
+    def async_add_residence(residence: LevitonResidence) -> None:
+        """Add the entities of a residence."""
+        if residence.id not in conf_residences:
+            return
+        entities: list[LevitonSwitchEntity] = []
+        entities.extend(
+            LevitonSwitchEntity(
+                coordinator=coordinator,
+                residence_id=residence.id,
+                entity_description=description,
             )
-            entities.extend(
-                LevitonSwitchEntity(
-                    coordinator=coordinator,
-                    residence_id=residence.id,
-                    schedule_id=schedule.id,
-                    entity_description=LevitonSwitchEntityDescription(
-                        key="schedule",
-                        name=None,
-                        icon="mdi:calendar-clock",
-                    ),
-                )
-                for schedule in residence.schedules
+            for description in SWITCH_DESCRIPTIONS
+            if hasattr(residence, description.key)
+        )
+        entities.extend(
+            LevitonSwitchEntity(
+                coordinator=coordinator,
+                residence_id=residence.id,
+                schedule_id=schedule.id,
+                entity_description=LevitonSwitchEntityDescription(
+                    key="schedule",
+                    name=None,
+                    icon="mdi:calendar-clock",
+                ),
             )
-            for device in residence.devices:
-                if device.id in conf_devices:
-                    if any(
-                        [
-                            device.is_outlet,
-                            device.is_switch,
-                        ]
-                    ):
-                        entities.append(
-                            LevitonSwitchEntity(
-                                coordinator=coordinator,
-                                residence_id=residence.id,
-                                device_id=device.id,
-                                entity_description=LevitonSwitchEntityDescription(
-                                    entity_category=None,
-                                    key="switch",
-                                    name=None,
-                                ),
-                            )
-                        )
-                    entities.extend(
+            for schedule in residence.schedules
+        )
+        for device in residence.devices:
+            if device.id in conf_devices:
+                if any(
+                    [
+                        device.is_outlet,
+                        device.is_switch,
+                    ]
+                ):
+                    entities.append(
                         LevitonSwitchEntity(
                             coordinator=coordinator,
                             residence_id=residence.id,
                             device_id=device.id,
-                            entity_description=description,
-                        )
-                        for description in SWITCH_DESCRIPTIONS
-                        if all(
-                            [
-                                hasattr(device, description.key),
-                                description.is_supported(device),
-                            ]
+                            entity_description=LevitonSwitchEntityDescription(
+                                entity_category=None,
+                                key="switch",
+                                name=None,
+                            ),
                         )
                     )
+                entities.extend(
+                    LevitonSwitchEntity(
+                        coordinator=coordinator,
+                        residence_id=residence.id,
+                        device_id=device.id,
+                        entity_description=description,
+                    )
+                    for description in SWITCH_DESCRIPTIONS
+                    if all(
+                        [
+                            hasattr(device, description.key),
+                            description.is_supported(device),
+                        ]
+                    )
+                )
+
+        async_add_entities(entities)
 
-    async_add_entities(entities)
+    async_setup_residences(hass, config_entry, async_add_residence)
 
 
 class LevitonSwitchEntity(SwitchEntity, LevitonEntity):
@@ -186,7 +193,7 @@ class LevitonSwitchEntity(SwitchEntity, LevitonEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
-        await super().async_turn_on(**kwargs)
+        await self.coordinator.async_add_executor_job(partial(self.turn_on, **kwargs))
         await self.coordinator.async_request_refresh()
 
     def turn_off(self, **kwargs: Any) -> None:
@@ -200,5 +207,5 @@ class LevitonSwitchEntity(SwitchEntity, LevitonEntity):
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
-        await super().async_turn_off(**kwargs)
+        await self.coordinator.async_add_executor_job(partial(self.turn_off, **kwargs))
         await self.coordinator.async_request_refresh()
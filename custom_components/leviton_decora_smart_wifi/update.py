@@ -10,12 +10,13 @@ from homeassistant.components.update import (
     UpdateEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .api.residence import Residence as LevitonResidence
 from .const import CONF_DEVICES, CONF_RESIDENCES, DATA_COORDINATOR, DOMAIN
-from .entity import LevitonEntity
+from .entity import LevitonEntity, async_setup_residences
 
 
 @dataclass(frozen=True)
@@ -36,25 +37,30 @@ async def async_setup_entry(
     conf_residences = entry[CONF_RESIDENCES]
     conf_devices = entry[CONF_DEVICES]
     coordinator = entry[DATA_COORDINATOR]
-    entities: list[LevitonUpdateEntity] = []
-
-    for residence in coordinator.data.residences:
-        if residence.id in conf_residences:
-            entities.extend(
-                LevitonUpdateEntity(
-                    coordinator=coordinator,
-                    residence_id=residence.id,
-                    device_id=device.id,
-                    entity_description=LevitonUpdateEntityDescription(
-                        key="update",
-                        name="Firmware",
-                    ),
-                )
-                for device in residence.devices
-                if device.id in conf_devices
+
+    @callback
+    def async_add_residence(residence: LevitonResidence) -> None:
+        """Add the entities of a residence."""
+        if residence.id not in conf_residences:
+            return
+        entities: list[LevitonUpdateEntity] = []
+        entities.extend(
+            LevitonUpdateEntity(
+                coordinator=coordinator,
+                residence_id=residence.id,
+                device_id=device.id,
+                entity_description=LevitonUpdateEntityDescription(
+                    key="update",
+                    name="Firmware",
+                ),
             )
+            for device in residence.devices
+            if device.id in conf_devices
+        )
+
+        async_add_entities(entities)
 
-    async_add_entities(entities)
+    async_setup_residences(hass, config_entry, async_add_residence)
 
 
 class LevitonUpdateEntity(UpdateEntity, LevitonEntity):
@@ -109,7 +115,9 @@ class LevitonUpdateEntity(UpdateEntity, LevitonEntity):
         """Flag supported features."""
         return UpdateEntityFeature.INSTALL
 
-    def install(self, version: str | None, backup: bool, **kwargs: Any) -> None:
+    async def async_install(
+        self, version: str | None, backup: bool, **kwargs: Any
+    ) -> None:
         """Install an update.
 
         Version can be specified to install a specific version. When `None`, the
@@ -119,4 +127,4 @@ class LevitonUpdateEntity(UpdateEntity, LevitonEntity):
         installing the update.
         """
         if self.device is not None:
-            self.device.apply_update()
+            await self.coordinator.async_add_executor_job(self.device.apply_update)
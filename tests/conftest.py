@@ -0,0 +1,10 @@
+"""Fixtures for the Leviton API tests."""
+
+from pathlib import Path
+import sys
+
+# Appended rather than prepended: the integration has modules (select,
+# number, ...) that would otherwise shadow the standard library.
+sys.path.append(
+    str(Path(__file__).parents[1] / "custom_components" / "leviton_decora_smart_wifi")
+)
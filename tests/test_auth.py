@@ -0,0 +1,37 @@
+"""Tests for the Leviton access token manager."""
+
+from datetime import UTC, datetime
+import threading
+
+from api import LevitonAPI
+from api.auth import LevitonTokenManager
+import requests
+
+
+def test_expires_at_without_offset_is_utc() -> None:
+    """A ``created`` without an offset is taken as UTC."""
+    token_manager = LevitonTokenManager(
+        login_response={"id": "token", "created": "2026-01-01T00:00:00", "ttl": 60}
+    )
+
+    assert token_manager.expires_at == datetime(2026, 1, 1, 0, 1, tzinfo=UTC)
+    assert token_manager.refresh_at < datetime.now(UTC)
+
+
+def test_invalid_token_on_login_does_not_log_in_again() -> None:
+    """A 401 on the login request doesn't re-enter the login lock."""
+    api = LevitonAPI(credentials={"email": "email", "password": "password"})
+    response = requests.Response()
+    response.status_code = 401
+    response._content = (
+        b'{"error": {"statusCode": 401, "name": "Error",'
+        b' "message": "Invalid Access Token"}}'
+    )
+    api.send = lambda function, idempotent=False: response
+
+    thread = threading.Thread(target=api.refresh_token, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    api.close()
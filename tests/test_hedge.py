@@ -0,0 +1,40 @@
+"""Tests for the Leviton API request hedging."""
+
+from http import HTTPMethod
+import io
+import time
+from typing import Any
+
+from api import LevitonAPI
+from api.hedge import MIN_SAMPLES
+from api.scheduler import LevitonRequestScheduler
+import pytest
+import requests
+
+KEY = "GET residences/{id}/iotswitches"
+
+
+@pytest.mark.parametrize(("max_in_flight", "sent_copies"), [(1, 1), (2, 2)])
+def test_hedged_copy_takes_a_slot(max_in_flight: int, sent_copies: int) -> None:
+    """A hedged copy is only sent when the scheduler has a slot for it."""
+    api = LevitonAPI(user_id="1", hedge=True)
+    api.scheduler = LevitonRequestScheduler(max_in_flight=max_in_flight)
+    for _ in range(MIN_SAMPLES):
+        api.hedger._record(KEY, 0.0)
+    sent = []
+
+    def request(**kwargs: Any) -> requests.Response:
+        sent.append(kwargs["url"])
+        time.sleep(0.2)
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(b"[]")
+        return response
+
+    api.session.request = request
+
+    assert api.call(method=HTTPMethod.GET, url="residences/1/iotswitches") == []
+    assert len(sent) == sent_copies
+    assert api.hedger.fired == 1
+    assert list(api.hedger.stats["thresholds"]) == [KEY]
+    api.close()
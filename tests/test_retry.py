@@ -0,0 +1,48 @@
+"""Tests for the Leviton API retry policy and circuit breaker."""
+
+from typing import Any
+
+from api import DeadlineExceeded, LevitonAPI
+from api.retry import LevitonCircuitBreaker
+import pytest
+import requests
+
+
+def ok() -> requests.Response:
+    """Return a successful response."""
+    response = requests.Response()
+    response.status_code = 200
+    return response
+
+
+def test_deadline_during_trial_lets_circuit_recover() -> None:
+    """A trial request that runs out of time doesn't keep the circuit open."""
+    api = LevitonAPI()
+    api.circuit_breaker = LevitonCircuitBreaker(threshold=1, cool_off=0.0)
+    api.circuit_breaker.record_failure()
+    assert api.circuit_breaker.state == "half_open"
+
+    def deadline() -> requests.Response:
+        raise DeadlineExceeded("residences")
+
+    with pytest.raises(DeadlineExceeded):
+        api.send(deadline)
+    response = ok()
+    assert api.send(lambda: response) is response
+    assert api.circuit_breaker.state == "closed"
+    api.close()
+
+
+def test_timeout_after_retries_fails_the_update() -> None:
+    """A session timeout surfaces as a deadline, which fails the update."""
+    api = LevitonAPI(user_id="1", retries=0)
+
+    def timeout(**kwargs: Any) -> requests.Response:
+        raise requests.exceptions.ReadTimeout("read timed out")
+
+    api.session.request = timeout
+
+    with pytest.raises(DeadlineExceeded):
+        api.update()
+    assert api.circuit_breaker.failures == 1
+    api.close()
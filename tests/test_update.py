@@ -0,0 +1,43 @@
+"""Tests for the Leviton API update."""
+
+from typing import Any
+
+from api import LevitonAPI, LevitonException
+
+RESIDENCES = [{"id": 1, "name": "Home"}, {"id": 2, "name": "Cabin"}]
+
+
+def client() -> LevitonAPI:
+    """Return an API whose calls are answered from memory.
+
+    Every endpoint of residence 2 fails, as during an outage mid-walk.
+    """
+    api = LevitonAPI(user_id="1")
+
+    def call(url: str, **kwargs: Any) -> Any:
+        if url.startswith("residences/2/"):
+            raise LevitonException(status_code=503, name="Error", message="down")
+        if url == "person/1/residentialpermissions":
+            return [{"residentialAccountId": 7}]
+        if url == "residentialaccounts/7/residences":
+            return [dict(residence) for residence in RESIDENCES]
+        if url == "residences/1/iotswitches":
+            return [{"id": 10, "name": "Switch", "power": "ON"}]
+        return []
+
+    api.call = call
+    return api
+
+
+def test_failure_mid_walk_keeps_completed_residences() -> None:
+    """Residences handed out before a failure stay in the data returned."""
+    api = client()
+    announced = []
+
+    data = api.update(on_residence=announced.append)
+
+    assert [residence.id for residence in announced] == [1]
+    assert [residence.id for residence in data.residences] == [1]
+    assert data.residences[0] is announced[0]
+    assert [device.id for device in data.residences[0].devices] == [10]
+    api.close()
@@ -0,0 +1,66 @@
+"""Tests for the Leviton WebSocket client."""
+
+import asyncio
+from collections.abc import AsyncIterator
+import json
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from api.websocket import LevitonWebSocket
+
+NOTIFICATION = {
+    "notification": {"modelName": "IotSwitch", "modelId": 1, "data": {"power": "ON"}}
+}
+
+
+class FakeSocket:
+    """A socket that delivers ``frames``, then stays open until closed."""
+
+    def __init__(self, frames: list[str]) -> None:
+        """Initialize."""
+        self.frames = frames
+        self.closed = False
+        self._closing = asyncio.Event()
+
+    def __aiter__(self) -> AsyncIterator[SimpleNamespace]:
+        """Iterate over the messages received."""
+        return self._messages()
+
+    async def _messages(self) -> AsyncIterator[SimpleNamespace]:
+        for frame in self.frames:
+            yield SimpleNamespace(type=aiohttp.WSMsgType.TEXT, data=frame)
+        await self._closing.wait()
+
+    async def close(self) -> bool:
+        """Close the socket."""
+        self.closed = True
+        self._closing.set()
+        return True
+
+
+def test_failed_dispatch_closes_socket() -> None:
+    """A consumer that raises closes the socket, ending the receive loop."""
+    received: list[dict[str, Any]] = []
+
+    async def receive() -> FakeSocket:
+        client = LevitonWebSocket(
+            session=None,
+            token_provider=dict,
+            on_notification=received.append,
+            batch_window=0.0,
+            max_pending_frames=1,
+        )
+        dispatch = client._dispatch_batch
+
+        def dispatch_then_fail(frames: list[str]) -> None:
+            dispatch(frames)
+            raise RuntimeError("dispatch")
+
+        client._dispatch_batch = dispatch_then_fail
+        ws = FakeSocket([json.dumps({"type": "notification", **NOTIFICATION})] * 3)
+        await asyncio.wait_for(client._receive_loop(ws), timeout=5)
+        return ws
+
+    assert asyncio.run(receive()).closed
+    assert received == [NOTIFICATION["notification"]]